@@ -0,0 +1,54 @@
+"""FastAPI entrypoint for the 命运模拟 admin backend."""
+
+import logging
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.database import AsyncSessionLocal, async_engine, get_async_db  # noqa: F401
+
+logger = logging.getLogger("admin")
+
+
+class ErrorLoggerMiddleware(BaseHTTPMiddleware):
+    """Log unhandled request errors with their traceback, then re-raise."""
+
+    async def dispatch(self, request, call_next):
+        try:
+            return await call_next(request)
+        except Exception:
+            # Lazy %-formatting and exception() keep the success path free
+            # and preserve the full traceback for the handler.
+            logger.exception("Request failed: %s", request.url)
+            raise
+
+
+from app.routers.character_router import router as character_router  # noqa: E402
+from app.routers.destiny_router import router as destiny_router  # noqa: E402
+from app.routers.mock_apis import router as mock_router  # noqa: E402
+from app.routers.pvp_router import router as pvp_router  # noqa: E402
+from app.routers.simulation_router import router as simulation_router  # noqa: E402
+from app.routers.simulation_stats import router as stats_router  # noqa: E402
+from app.routers.society_router import router as society_router  # noqa: E402
+from app.routers.theater_router import router as theater_router  # noqa: E402
+from app.routers.ws_simulation import router as ws_router, start_subscriber  # noqa: E402
+
+# orjson serializes the large simulate/interact payloads several times
+# faster than the stdlib encoder and emits bytes directly.
+app = FastAPI(title="命运模拟 Admin", default_response_class=ORJSONResponse)
+app.add_middleware(ErrorLoggerMiddleware)
+app.include_router(character_router)
+app.include_router(destiny_router)
+app.include_router(pvp_router)
+app.include_router(simulation_router)
+app.include_router(society_router)
+app.include_router(stats_router)
+app.include_router(theater_router)
+app.include_router(ws_router)
+app.include_router(mock_router)
+
+
+@app.on_event("startup")
+async def _start_ws_subscriber():
+    start_subscriber()
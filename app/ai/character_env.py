@@ -0,0 +1,182 @@
+"""单角色 RL environment: the PPO agent lives out a character's choices.
+
+State is the same 18-dim profile vector used everywhere else (see
+:mod:`app.ai.utils`); actions are the Chinese action names, optionally
+extended to the richer interaction set by
+:func:`create_interaction_environment`.
+"""
+
+import numpy as np
+
+try:  # pyahocorasick is optional: scenario parsing falls back to substring scans
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:  # pragma: no cover
+    HAS_AHOCORASICK = False
+
+from app.ai.utils import ACTION_NAMES, EMO_OFF, STATE_DIM, TRUST_OFF, build_state
+
+_JOY = EMO_OFF
+_ANGER = EMO_OFF + 1
+_SADNESS = EMO_OFF + 2
+_FEAR = EMO_OFF + 3
+
+# 场景关键词 -> (state index, preset value). One table feeds both the
+# Aho-Corasick automaton and the substring fallback.
+_SCENARIO_TRIGGERS = (
+    ("冲突", _ANGER, 0.6),
+    ("危机", _FEAR, 0.7),
+    ("喜事", _JOY, 0.8),
+    ("失去", _SADNESS, 0.7),
+    ("背叛", TRUST_OFF, 0.2),
+    ("合作", TRUST_OFF, 0.7),
+    ("竞争", _ANGER, 0.4),
+    ("考验", _FEAR, 0.4),
+    ("机遇", _JOY, 0.6),
+    ("离别", _SADNESS, 0.5),
+    ("重逢", _JOY, 0.7),
+    ("压力", _FEAR, 0.5),
+)
+
+# Immutable, shared across all envs/threads — never rebuilt per call.
+_INTERACTION_ACTIONS = (
+    "合作", "竞争", "分享", "帮助", "欺骗", "谈判",
+    "攻击", "防御", "挑衅", "安抚", "退让", "观察",
+)
+_AGGRESSIVE_ACTIONS = frozenset(("攻击", "挑衅", "竞争"))
+_DEFENSIVE_ACTIONS = frozenset(("防御", "退让", "观察"))
+_FRIENDLY_ACTIONS = frozenset(("安抚", "合作", "分享", "帮助"))
+
+if HAS_AHOCORASICK:
+    _SCENARIO_AC = ahocorasick.Automaton()
+    for _keyword, _idx, _value in _SCENARIO_TRIGGERS:
+        _SCENARIO_AC.add_word(_keyword, (_idx, _value))
+    _SCENARIO_AC.make_automaton()
+else:
+    _SCENARIO_AC = None
+
+
+class CharacterEnvironment:
+    """Single character stepping through abstract life decisions."""
+
+    def __init__(self, profile: dict, max_steps: int = 50):
+        self.profile = profile
+        self.max_steps = max_steps
+        self.action_space = ACTION_NAMES
+        self.state = build_state(profile)
+        self._initial = self.state.copy()
+        self.steps = 0
+
+    def reset(self) -> np.ndarray:
+        self.steps = 0
+        np.copyto(self.state, self._initial)
+        return self.state
+
+    def configure_scenario(self, scenario: str) -> None:
+        """根据场景描述预置情绪与信任状态。
+
+        Writes the presets into the reset snapshot as well, so rollouts
+        that reset() before their first step keep the scenario state.
+        """
+        if not scenario:
+            return
+        state = self.state
+        initial = self._initial
+        if _SCENARIO_AC is not None:
+            # One automaton pass over the text instead of K substring scans.
+            for _, (idx, value) in _SCENARIO_AC.iter(scenario):
+                state[idx] = value
+                initial[idx] = value
+        else:
+            for keyword, idx, value in _SCENARIO_TRIGGERS:
+                if keyword in scenario:
+                    state[idx] = value
+                    initial[idx] = value
+
+    def step(self, action_idx: int):
+        action = self.action_space[action_idx]
+        state = self.state
+        if action in _AGGRESSIVE_ACTIONS:
+            state[_ANGER] += 0.1
+            state[_JOY] -= 0.02
+        elif action in _DEFENSIVE_ACTIONS:
+            state[_FEAR] -= 0.05
+        elif action in _FRIENDLY_ACTIONS:
+            state[_JOY] += 0.05
+            state[TRUST_OFF] += 0.05
+        elif action == "欺骗":
+            state[TRUST_OFF] -= 0.1
+            state[_JOY] += 0.03
+        elif action == "谈判":
+            state[_ANGER] -= 0.05
+            state[TRUST_OFF] += 0.02
+        np.clip(state[_JOY:_FEAR + 1], 0.0, 1.0, out=state[_JOY:_FEAR + 1])
+        state[TRUST_OFF] = min(1.0, max(0.0, state[TRUST_OFF]))
+
+        reward = float(
+            state[_JOY]
+            - 0.5 * (state[_ANGER] + state[_SADNESS] + state[_FEAR])
+            + 0.3 * state[TRUST_OFF]
+        )
+        self.steps += 1
+        done = self.steps >= self.max_steps
+        return self.state, reward, done, {}
+
+
+class VectorCharacterEnvironment:
+    """Lock-step batch of environments behind one ``step(actions)`` call.
+
+    EnvPool-style sync API: ``reset`` returns an ``(N, STATE_DIM)`` batch,
+    ``step`` takes an ``(N,)`` action vector and autoresets finished envs,
+    so the policy always sees a full batch and one forward serves N envs.
+    """
+
+    def __init__(self, envs):
+        self.envs = list(envs)
+        self.num_envs = len(self.envs)
+        self._obs = np.empty((self.num_envs, STATE_DIM), dtype=np.float32)
+
+    def reset(self) -> np.ndarray:
+        for i, env in enumerate(self.envs):
+            self._obs[i] = env.reset()
+        return self._obs
+
+    def step(self, actions):
+        rewards = np.empty(self.num_envs, dtype=np.float32)
+        dones = np.empty(self.num_envs, dtype=np.bool_)
+        for i, env in enumerate(self.envs):
+            state, reward, done, _ = env.step(int(actions[i]))
+            if done:  # autoreset: the returned obs is the next episode's start
+                state = env.reset()
+            self._obs[i] = state
+            rewards[i] = reward
+            dones[i] = done
+        return self._obs, rewards, dones, {}
+
+
+class InteractionEnvironment(CharacterEnvironment):
+    """双角色互动 environment:第一个角色行动,第二个角色的性格影响回报。"""
+
+    _COOP_ACTIONS = frozenset(("合作", "分享", "帮助"))
+
+    def __init__(self, profile1: dict, profile2: dict, scenario: str = "",
+                 max_steps: int = 50):
+        super().__init__(profile1, max_steps=max_steps)
+        self.other_character = profile2
+        self.action_space = _INTERACTION_ACTIONS
+        if scenario:
+            self.configure_scenario(scenario)
+
+    def step(self, action_idx: int):
+        next_state, reward, done, info = super().step(action_idx)
+        if self.action_space[action_idx] in self._COOP_ACTIONS:
+            agreeableness = self.other_character.get("A", 0.5)
+            if agreeableness > 0.6:
+                reward *= 1.2
+            elif agreeableness < 0.3:
+                reward *= 0.8
+        return next_state, reward, done, info
+
+
+def create_interaction_environment(profile1: dict, profile2: dict, scenario: str = ""):
+    return InteractionEnvironment(profile1, profile2, scenario)
@@ -0,0 +1,89 @@
+"""多智能体群体模拟: run many characters against each other in one pass.
+
+Writes are batched: every step's causal events and character updates are
+accumulated in Python and flushed with one executemany INSERT plus one
+executemany UPDATE, so an N-agent simulation costs two round trips
+instead of 2N.
+"""
+
+import random
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.causal import CausalEvent
+from app.models.character import Character
+
+_ACTION_IMPACT = {
+    "攻击": -2.0,
+    "挑衅": -1.0,
+    "防御": 0.0,
+    "退让": 0.0,
+    "安抚": 1.0,
+    "合作": 2.0,
+}
+
+
+def simple_decide(character: Character) -> str:
+    """Pick an action from the character's Big Five profile.
+
+    Cheap heuristic policy for crowd simulation — the PPO agents are only
+    used for the featured characters.
+    """
+    personality = character.personality or {}
+    agreeableness = personality.get("A", 0.5)
+    neuroticism = personality.get("N", 0.5)
+    extraversion = personality.get("E", 0.5)
+    if agreeableness > 0.6:
+        return "合作" if extraversion > 0.5 else "安抚"
+    if neuroticism > 0.6:
+        return "攻击" if extraversion > 0.5 else "防御"
+    return random.choice(("挑衅", "退让", "合作"))
+
+
+async def simulate_multiple_agents(
+    session: AsyncSession, character_ids: list, steps: int = 1
+) -> dict:
+    """Simulate ``steps`` rounds of pairwise interactions among the group.
+
+    Returns per-character fate deltas and the number of events recorded.
+    """
+    result = await session.execute(
+        select(Character).where(Character.id.in_(character_ids))
+    )
+    characters = result.scalars().all()
+    if len(characters) < 2:
+        return {"events": 0, "fate_deltas": {}}
+
+    event_rows = []
+    fate_deltas = {c.id: 0.0 for c in characters}
+    for _ in range(steps):
+        for actor in characters:
+            target = random.choice(characters)
+            if target.id == actor.id:
+                continue
+            action = simple_decide(actor)
+            impact = _ACTION_IMPACT.get(action, 0.0)
+            event_rows.append({
+                "actor_id": actor.id,
+                "target_id": target.id,
+                "action": action,
+                "description": f"{actor.name}对{target.name}采取了{action}",
+                "payload": {"impact": impact},
+            })
+            fate_deltas[target.id] += impact
+
+    if event_rows:
+        await session.execute(insert(CausalEvent), event_rows)
+    updates = [
+        {
+            "id": character.id,
+            "fate_score": max(0.0, min(100.0, character.fate_score + delta)),
+        }
+        for character in characters
+        if (delta := fate_deltas[character.id]) != 0.0
+    ]
+    if updates:
+        await session.execute(update(Character), updates)
+    await session.commit()
+    return {"events": len(event_rows), "fate_deltas": fate_deltas}
@@ -0,0 +1,21 @@
+"""Actor-critic 策略网络 used by the PPO trainer and per-character agents."""
+
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+
+class PolicyNetwork(nn.Module):
+    """Small actor-critic MLP: state vector -> (action logits, state value)."""
+
+    def __init__(self, state_dim: int = 18, hidden_dim: int = 128, action_dim: int = 6):
+        super().__init__()
+        self.fc1 = nn.Linear(state_dim, hidden_dim)
+        self.fc2 = nn.Linear(hidden_dim, hidden_dim)
+        self.action_head = nn.Linear(hidden_dim, action_dim)
+        self.value_head = nn.Linear(hidden_dim, 1)
+
+    def forward(self, x: torch.Tensor):
+        x = F.relu(self.fc1(x))
+        x = F.relu(self.fc2(x))
+        return self.action_head(x), self.value_head(x)
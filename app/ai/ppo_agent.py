@@ -0,0 +1,140 @@
+"""PPO agent: action selection, GAE and clipped-surrogate updates."""
+
+import numpy as np
+import torch
+from torch.distributions import Categorical
+
+from app.ai.policy_model import PolicyNetwork
+from app.ai.utils import HAS_NUMBA, njit
+
+
+@njit(fastmath=True, cache=True)
+def _gae(rewards, values, dones, last_value, gamma, lam):
+    """GAE scalar recurrence; njit-compiled when numba is installed."""
+    n = rewards.shape[0]
+    advantages = np.empty(n, dtype=np.float32)
+    gae = 0.0
+    next_value = last_value
+    for t in range(n - 1, -1, -1):
+        mask = 1.0 - np.float32(dones[t])
+        delta = rewards[t] + gamma * next_value * mask - values[t]
+        gae = delta + gamma * lam * mask * gae
+        advantages[t] = gae
+        next_value = values[t]
+    return advantages
+
+
+if HAS_NUMBA:  # warm-compile so the first request doesn't pay JIT latency
+    _gae(
+        np.zeros(2, dtype=np.float32), np.zeros(2, dtype=np.float32),
+        np.zeros(2, dtype=np.bool_), 0.0, 0.99, 0.95,
+    )
+
+
+class PPOAgent:
+    def __init__(self, state_dim: int, action_dim: int, lr: float = 3e-4,
+                 gamma: float = 0.99, lam: float = 0.95,
+                 clip_epsilon: float = 0.2, epochs: int = 4):
+        self.state_dim = state_dim
+        self.action_dim = action_dim
+        self.gamma = gamma
+        self.lam = lam
+        self.clip_epsilon = clip_epsilon
+        self.epochs = epochs
+        self.policy = PolicyNetwork(state_dim, action_dim=action_dim)
+        self.optimizer = torch.optim.Adam(self.policy.parameters(), lr=lr)
+        self.param_bytes = sum(
+            p.numel() * p.element_size() for p in self.policy.parameters()
+        )
+
+    def select_action(self, state, state_tensor=None):
+        """Sample one action; pass a preallocated ``(1, state_dim)`` tensor
+        to reuse it across steps instead of allocating per call.
+
+        Returns ``(action, log_prob, value)`` — the value head comes out of
+        the same forward, so callers never need a second policy pass.
+        """
+        if state_tensor is None:
+            state_tensor = torch.FloatTensor(state).unsqueeze(0)
+        else:
+            state_tensor[0].copy_(torch.as_tensor(state))
+        with torch.no_grad():
+            logits, value = self.policy(state_tensor)
+        dist = Categorical(logits=logits)
+        action = dist.sample()
+        return (
+            int(action.item()),
+            float(dist.log_prob(action).item()),
+            float(value.item()),
+        )
+
+    def select_action_batch(self, states):
+        """One forward pass for a whole ``(N, state_dim)`` batch of states."""
+        batch = torch.as_tensor(states)
+        with torch.no_grad():
+            logits, _ = self.policy(batch)
+        dist = Categorical(logits=logits)
+        actions = dist.sample()
+        return actions.numpy(), dist.log_prob(actions).numpy()
+
+    def select_action_greedy(self, states):
+        """Deterministic fast path: argmax over the logits, skipping the
+        Categorical construction and log-softmax that sampling pays."""
+        batch = torch.as_tensor(states)
+        with torch.no_grad():
+            logits, _ = self.policy(batch)
+        return logits.argmax(dim=-1).numpy()
+
+    def compute_returns_and_advantages(self, rewards, values, dones, last_value):
+        """GAE over contiguous float32/bool arrays.
+
+        The recurrence is inherently sequential, so it lives in the free
+        function :func:`_gae` where numba can compile it to native code;
+        returns come out as one vectorized ``advantages + values``.
+        """
+        advantages = _gae(
+            np.ascontiguousarray(rewards, dtype=np.float32),
+            np.ascontiguousarray(values, dtype=np.float32),
+            np.ascontiguousarray(dones, dtype=np.bool_),
+            float(last_value), self.gamma, self.lam,
+        )
+        return advantages + values, advantages
+
+    def update_policy(self, states, actions, old_log_probs, returns, advantages):
+        # from_numpy shares the trajectory buffers' memory — no re-stack copy.
+        states_t = torch.from_numpy(np.asarray(states, dtype=np.float32))
+        actions_t = torch.from_numpy(np.asarray(actions, dtype=np.int64))
+        old_log_probs_t = torch.from_numpy(np.asarray(old_log_probs, dtype=np.float32))
+        returns_t = torch.from_numpy(np.asarray(returns, dtype=np.float32))
+        advantages_t = torch.from_numpy(np.asarray(advantages, dtype=np.float32))
+        advantages_t = (advantages_t - advantages_t.mean()) / (advantages_t.std() + 1e-8)
+
+        for _ in range(self.epochs):
+            logits, values = self.policy(states_t)
+            dist = Categorical(logits=logits)
+            log_probs = dist.log_prob(actions_t)
+            ratio = torch.exp(log_probs - old_log_probs_t)
+            surr1 = ratio * advantages_t
+            surr2 = torch.clamp(
+                ratio, 1.0 - self.clip_epsilon, 1.0 + self.clip_epsilon
+            ) * advantages_t
+            policy_loss = -torch.min(surr1, surr2).mean()
+            value_loss = (returns_t - values.squeeze(-1)).pow(2).mean()
+            entropy = dist.entropy().mean()
+            loss = policy_loss + 0.5 * value_loss - 0.01 * entropy
+
+            self.optimizer.zero_grad()
+            loss.backward()
+            self.optimizer.step()
+
+    def save_model(self, path: str) -> None:
+        torch.save(
+            {"policy": self.policy.state_dict(),
+             "optimizer": self.optimizer.state_dict()},
+            path,
+        )
+
+    def load_model(self, path: str) -> None:
+        checkpoint = torch.load(path, map_location="cpu")
+        self.policy.load_state_dict(checkpoint["policy"])
+        self.optimizer.load_state_dict(checkpoint["optimizer"])
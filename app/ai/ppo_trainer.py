@@ -0,0 +1,232 @@
+"""PPO trainer for character agents.
+
+Rollouts run against ``VecEnv`` — K environment worker processes stepped in
+lock-step — so the policy forward sees an ``(K, state_dim)`` batch instead of
+K separate single-sample calls.
+"""
+
+import multiprocessing as mp
+
+import numpy as np
+import torch
+from torch.distributions import Categorical
+
+from app.ai.policy_model import PolicyNetwork
+
+
+def _env_worker(pipe, env_fn):
+    """Worker loop: own one env instance, answer reset/step commands."""
+    env = env_fn()
+    try:
+        while True:
+            cmd, data = pipe.recv()
+            if cmd == "reset":
+                state, _info = env.reset()
+                pipe.send(state)
+            elif cmd == "step":
+                state, reward, terminated, truncated, info = env.step(data)
+                done = terminated or truncated
+                if done:
+                    state, _info = env.reset()
+                pipe.send((state, reward, done))
+            elif cmd == "close":
+                break
+    finally:
+        pipe.close()
+
+
+class VecEnv:
+    """Run K environments in worker processes behind a batched step() API.
+
+    A persistent ``states_np`` buffer of shape ``(K, state_dim)`` is reused
+    across steps; ``torch.from_numpy`` on it is zero-copy, so the policy
+    consumes the batch without any per-env tensor construction.
+    """
+
+    def __init__(self, env_fns, state_dim: int = 18):
+        self.num_envs = len(env_fns)
+        self.state_dim = state_dim
+        self._pipes = []
+        self._procs = []
+        for fn in env_fns:
+            parent, child = mp.Pipe()
+            proc = mp.Process(target=_env_worker, args=(child, fn), daemon=True)
+            proc.start()
+            child.close()
+            self._pipes.append(parent)
+            self._procs.append(proc)
+        self.states_np = np.empty((self.num_envs, state_dim), dtype=np.float32)
+
+    def reset(self) -> np.ndarray:
+        for pipe in self._pipes:
+            pipe.send(("reset", None))
+        for i, pipe in enumerate(self._pipes):
+            self.states_np[i] = pipe.recv()
+        return self.states_np
+
+    def step(self, actions):
+        for pipe, action in zip(self._pipes, actions):
+            pipe.send(("step", int(action)))
+        rewards = np.empty(self.num_envs, dtype=np.float32)
+        dones = np.empty(self.num_envs, dtype=np.bool_)
+        for i, pipe in enumerate(self._pipes):
+            state, rewards[i], dones[i] = pipe.recv()
+            self.states_np[i] = state
+        return self.states_np, rewards, dones
+
+    def close(self):
+        for pipe in self._pipes:
+            try:
+                pipe.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=1.0)
+
+
+class PPOTrainer:
+    """Clipped-surrogate PPO over a vectorized environment."""
+
+    def __init__(self, env_fn, num_envs: int = 8, state_dim: int = 18,
+                 action_dim: int = 6, lr: float = 3e-4, gamma: float = 0.99,
+                 clip_eps: float = 0.2, epochs: int = 4):
+        self.state_dim = state_dim
+        self.action_dim = action_dim
+        self.gamma = gamma
+        self.clip_eps = clip_eps
+        self.epochs = epochs
+        self.policy = PolicyNetwork(state_dim, action_dim=action_dim)
+        # Scripted copy for inference only: fuses the Linear/ReLU chain and
+        # drops Python dispatch from the per-step forward. Training keeps the
+        # eager module so autograd and the optimizer see the same parameters.
+        self.policy_infer = torch.jit.script(self.policy)
+        self.optimizer = torch.optim.Adam(self.policy.parameters(), lr=lr)
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        if self.device.type == "cuda":
+            self.policy.to(self.device)
+        # CUDA Graph state for the fixed-shape rollout forward (lazy init).
+        self._graph = None
+        self._graph_in = None
+        self._graph_logits = None
+        # Persistent single-state buffer for run_step; pinned on CUDA builds
+        # so the H2D copy can be async.
+        self._state_buf = torch.empty(
+            (1, state_dim), dtype=torch.float32,
+            pin_memory=torch.cuda.is_available(),
+        )
+        self.env = VecEnv([env_fn] * num_envs, state_dim=state_dim)
+
+    def _capture_rollout_graph(self, batch_shape):
+        """Capture the rollout forward into a CUDA Graph.
+
+        The rollout calls the policy with an identical (K, state_dim) shape
+        every step, so the dozens of kernel launches per forward collapse
+        into a single graph replay.
+        """
+        self._graph_in = torch.empty(batch_shape, device=self.device)
+        for _ in range(3):  # warm-up: cuBLAS handles, allocator steady state
+            with torch.no_grad():
+                self.policy(self._graph_in)
+        torch.cuda.synchronize()
+        self._graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(self._graph):
+            with torch.no_grad():
+                self._graph_logits, _ = self.policy(self._graph_in)
+
+    def _rollout_logits(self, batch: torch.Tensor) -> torch.Tensor:
+        """Policy logits for one rollout step, via graph replay on GPU."""
+        if self.device.type != "cuda":
+            with torch.no_grad():
+                logits, _ = self.policy_infer(batch)
+            return logits
+        if self._graph is None or self._graph_in.shape != batch.shape:
+            self._capture_rollout_graph(batch.shape)
+        self._graph_in.copy_(batch, non_blocking=True)
+        self._graph.replay()
+        return self._graph_logits
+
+    def train(self, rollout_len: int = 128, iterations: int = 10):
+        """Collect ``rollout_len`` lock-step transitions from all K envs per
+        iteration, then run a PPO update on the gathered batch."""
+        K = self.env.num_envs
+        states_buf = torch.empty(rollout_len, K, self.state_dim)
+        actions_buf = torch.empty(rollout_len, K, dtype=torch.long)
+        rewards_buf = torch.empty(rollout_len, K)
+        dones_buf = torch.empty(rollout_len, K, dtype=torch.bool)
+
+        states = self.env.reset()
+        for _ in range(iterations):
+            for t in range(rollout_len):
+                batch = torch.from_numpy(states)
+                states_buf[t].copy_(batch)
+                logits = self._rollout_logits(batch)
+                # Sample on the logits' device, then bring the K action ids
+                # back to host — env.step and the rollout buffers live there.
+                actions = Categorical(logits=logits).sample().cpu()
+                actions_buf[t] = actions
+                states, rewards, dones = self.env.step(actions.numpy())
+                rewards_buf[t] = torch.from_numpy(rewards)
+                dones_buf[t] = torch.from_numpy(dones)
+            self.update(states_buf, actions_buf, rewards_buf, dones_buf)
+
+    def _discounted_returns(self, rewards, dones):
+        """Discounted returns over a ``(T, K)`` reward/done batch.
+
+        Without episode boundaries the whole thing is a reverse cumsum of
+        gamma-scaled rewards; with dones we fall back to a per-step tensor
+        scan (still one tensor op per step, never per sample).
+        """
+        T, _ = rewards.shape
+        if not bool(dones.any()):
+            discounts = self.gamma ** torch.arange(T, dtype=torch.float32).unsqueeze(1)
+            scaled = rewards * discounts
+            return torch.flip(torch.cumsum(torch.flip(scaled, [0]), 0), [0]) / discounts
+        returns = torch.empty_like(rewards)
+        G = torch.zeros(rewards.shape[1])
+        not_done = (~dones).float()
+        for t in range(T - 1, -1, -1):
+            G = rewards[t] + self.gamma * G * not_done[t]
+            returns[t] = G
+        return returns
+
+    def update(self, states, actions, rewards, dones):
+        """One PPO update over a ``(T, K, ...)`` rollout.
+
+        The whole rollout goes through the policy as a single batch: one
+        forward + one backward per epoch rather than one per timestep.
+        """
+        T, K, _ = states.shape
+        returns = self._discounted_returns(rewards, dones)
+
+        # The rollout buffers are host-side; move the flattened batch to the
+        # policy's device once for all epochs (no-op on CPU builds).
+        flat_states = states.reshape(T * K, self.state_dim).to(self.device)
+        flat_actions = actions.reshape(T * K).to(self.device)
+        flat_returns = returns.reshape(T * K).to(self.device)
+
+        with torch.no_grad():
+            old_logits, _ = self.policy(flat_states)
+            old_log_probs = Categorical(logits=old_logits).log_prob(flat_actions)
+
+        for _ in range(self.epochs):
+            logits, values = self.policy(flat_states)
+            dist = Categorical(logits=logits)
+            new_log_probs = dist.log_prob(flat_actions)
+            advantages = flat_returns - values.squeeze(-1)
+            ratio = torch.exp(new_log_probs - old_log_probs)
+            surr1 = ratio * advantages.detach()
+            surr2 = torch.clamp(ratio, 1 - self.clip_eps, 1 + self.clip_eps) * advantages.detach()
+            loss = (-torch.min(surr1, surr2) + 0.5 * advantages.pow(2)).mean()
+            self.optimizer.zero_grad()
+            loss.backward()
+            self.optimizer.step()
+
+    def run_step(self, state) -> int:
+        """Single-state inference step used by the serving path."""
+        np.copyto(self._state_buf.numpy()[0], state)
+        # The pinned host buffer stages an async H2D copy; on CPU builds
+        # .to() returns the buffer itself.
+        batch = self._state_buf.to(self.device, non_blocking=True)
+        with torch.no_grad():
+            logits, _ = self.policy_infer(batch)
+        return int(Categorical(logits=logits).sample())
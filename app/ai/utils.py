@@ -0,0 +1,122 @@
+"""Shared helpers for the RL side: state vectors and reward shaping."""
+
+import numpy as np
+
+try:  # numba is optional: the kernels fall back to the NumPy paths without it
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+STATE_DIM = 18
+
+# Fixed layout of the 18-dim state vector. Index tables are built once at
+# import time so build_state is straight array writes, no list growth.
+BIG5 = ("O", "C", "E", "A", "N")
+WUXING = ("金", "木", "水", "火", "土")
+EMOTIONS = ("joy", "anger", "sadness", "fear")
+ATTRIBUTES = ("physique", "intelligence", "social")
+
+BIG5_OFF = 0
+WUXING_OFF = 5
+EMO_OFF = 10
+ATTR_OFF = 14
+TRUST_OFF = 17
+
+
+def build_state(profile: dict, out: np.ndarray = None) -> np.ndarray:
+    """Pack a character profile into a float32[18] state vector.
+
+    Writes directly into ``out`` when given so callers can reuse a
+    preallocated buffer across env steps.
+    """
+    if out is None:
+        out = np.empty(STATE_DIM, dtype=np.float32)
+    wuxing = profile.get("wuxing", {})
+    emotion = profile.get("emotion_state", {})
+    attributes = profile.get("attributes", {})
+    for i, key in enumerate(BIG5):
+        out[BIG5_OFF + i] = profile.get(key, 0.5)
+    for i, key in enumerate(WUXING):
+        out[WUXING_OFF + i] = wuxing.get(key, 0.0)
+    for i, key in enumerate(EMOTIONS):
+        out[EMO_OFF + i] = emotion.get(key, 0.0)
+    for i, key in enumerate(ATTRIBUTES):
+        out[ATTR_OFF + i] = attributes.get(key, 5.0) / 10.0
+    out[TRUST_OFF] = profile.get("trust", 0.5)
+    return out
+
+
+ACTION_NAMES = ("攻击", "防御", "挑衅", "安抚", "合作", "退让")
+
+# Branchless reward kernel: reward = (REWARD_COEF[a] * emotion).sum() + REWARD_BIAS[a]
+# with emotion = state[10:14] = (joy, anger, sadness, fear). One row per action,
+# precomputed so scalar and batched paths share the same table.
+REWARD_COEF = np.array([
+    # joy   anger  sadness fear
+    [-0.2,  0.5,   0.1,    0.2],   # 攻击
+    [0.1,  -0.3,   0.0,   -0.2],   # 防御
+    [-0.1,  0.4,   0.2,    0.1],   # 挑衅
+    [0.3,  -0.4,  -0.3,   -0.1],   # 安抚
+    [0.4,  -0.2,  -0.1,    0.0],   # 合作
+    [0.0,  -0.1,   0.2,   -0.3],   # 退让
+], dtype=np.float32)
+REWARD_BIAS = np.array([0.0, 0.05, -0.05, 0.1, 0.15, -0.1], dtype=np.float32)
+
+
+@njit(cache=True)
+def _reward_core(emotion, coef_row, bias):
+    total = bias
+    for i in range(emotion.shape[0]):
+        total += coef_row[i] * emotion[i]
+    return total
+
+
+@njit(cache=True)
+def _reward_batch_core(emotions, actions, coef, bias, out):
+    for k in range(emotions.shape[0]):
+        a = actions[k]
+        total = bias[a]
+        for i in range(emotions.shape[1]):
+            total += coef[a, i] * emotions[k, i]
+        out[k] = total
+    return out
+
+
+def compute_reward(state: np.ndarray, action: int) -> float:
+    """Reward for one state/action pair."""
+    emotion = state[EMO_OFF:EMO_OFF + 4]
+    return float(_reward_core(emotion, REWARD_COEF[action], REWARD_BIAS[action]))
+
+
+def compute_reward_batch(states: np.ndarray, actions: np.ndarray) -> np.ndarray:
+    """Rewards for ``(K, 18)`` states and ``(K,)`` actions in one shot."""
+    emotion = np.ascontiguousarray(states[:, EMO_OFF:EMO_OFF + 4])
+    if HAS_NUMBA:
+        out = np.empty(states.shape[0], dtype=np.float32)
+        return _reward_batch_core(emotion, actions, REWARD_COEF, REWARD_BIAS, out)
+    return (REWARD_COEF[actions] * emotion).sum(axis=1) + REWARD_BIAS[actions]
+
+
+if HAS_NUMBA:
+    # Warm the JIT cache at import so the first env step doesn't pay for
+    # compilation.
+    _reward_core(np.zeros(4, dtype=np.float32), REWARD_COEF[0], REWARD_BIAS[0])
+    _reward_batch_core(
+        np.zeros((1, 4), dtype=np.float32), np.zeros(1, dtype=np.int64),
+        REWARD_COEF, REWARD_BIAS, np.empty(1, dtype=np.float32),
+    )
+
+
+def build_state_batch(profiles, out: np.ndarray = None) -> np.ndarray:
+    """Pack N profiles into an (N, 18) batch a vec-env can feed the policy."""
+    if out is None:
+        out = np.empty((len(profiles), STATE_DIM), dtype=np.float32)
+    for i, profile in enumerate(profiles):
+        build_state(profile, out=out[i])
+    return out
@@ -0,0 +1,28 @@
+"""Bearer-token authentication dependency."""
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.models.user import User
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(_bearer),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    if credentials is None:
+        raise HTTPException(status_code=401, detail="未认证")
+    result = await db.execute(
+        select(User).where(
+            User.api_token == credentials.credentials, User.is_active.is_(True)
+        )
+    )
+    user = result.scalar_one_or_none()
+    if user is None:
+        raise HTTPException(status_code=401, detail="无效的凭证")
+    return user
@@ -0,0 +1,67 @@
+"""Redis 缓存薄封装:短 TTL 缓存热点读路径.
+
+redis (and a reachable server) are optional: every helper degrades to a
+no-op / cache-miss so the DB fallback path always works in dev and tests.
+"""
+
+import os
+
+import orjson
+
+try:  # redis is optional: without it every lookup is a miss
+    import redis.asyncio as redis
+    HAS_REDIS = True
+except ImportError:  # pragma: no cover
+    HAS_REDIS = False
+
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+
+REGIME_KEY = "regime:latest"
+REGIME_TTL = 5  # seconds — just enough to absorb read bursts
+
+_client = redis.Redis.from_url(REDIS_URL) if HAS_REDIS else None
+
+
+async def get_cached(key: str):
+    """Return the cached payload for ``key`` or None on miss/unavailable."""
+    if _client is None:
+        return None
+    try:
+        raw = await _client.get(key)
+    except redis.RedisError:
+        return None
+    return orjson.loads(raw) if raw else None
+
+
+async def set_cached(key: str, payload: dict, ttl: int) -> None:
+    if _client is None:
+        return
+    try:
+        await _client.setex(key, ttl, orjson.dumps(payload, default=str))
+    except redis.RedisError:
+        pass
+
+
+async def invalidate(key: str) -> None:
+    if _client is None:
+        return
+    try:
+        await _client.delete(key)
+    except redis.RedisError:
+        pass
+
+
+async def publish(channel: str, payload: bytes) -> bool:
+    """Publish ``payload`` on ``channel``; False when Redis is unavailable."""
+    if _client is None:
+        return False
+    try:
+        await _client.publish(channel, payload)
+        return True
+    except redis.RedisError:
+        return False
+
+
+def pubsub():
+    """A PubSub handle, or None when Redis is unavailable."""
+    return _client.pubsub() if _client is not None else None
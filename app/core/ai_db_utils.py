@@ -0,0 +1,50 @@
+"""Async DB helpers shared by the AI simulation paths."""
+
+from sqlalchemy import cast, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.causal import CausalEvent
+from app.models.character import Character
+
+
+async def save_causal_event(session: AsyncSession, event: CausalEvent) -> CausalEvent:
+    """Persist a causal event inside the caller's transaction.
+
+    Only flushes — the PK comes back via RETURNING on the INSERT, and the
+    caller owns the commit. Use :func:`save_causal_event_and_commit` for
+    standalone writes outside a unit of work.
+    """
+    session.add(event)
+    await session.flush()
+    return event
+
+
+async def save_causal_event_and_commit(session: AsyncSession, event: CausalEvent) -> CausalEvent:
+    """Standalone variant for callers without an enclosing transaction."""
+    await save_causal_event(session, event)
+    await session.commit()
+    return event
+
+
+async def update_character_state(session: AsyncSession, character_id: int,
+                                 new_attributes: dict = None,
+                                 new_personality: dict = None) -> None:
+    """Merge partial attribute/personality updates into a character.
+
+    The merge happens server-side via the jsonb ``||`` operator in a single
+    UPDATE — no prior SELECT, and concurrent partial updates don't clobber
+    each other's keys.
+    """
+    values = {}
+    if new_attributes:
+        values["attributes"] = Character.attributes.op("||")(cast(new_attributes, JSONB))
+    if new_personality:
+        values["personality"] = Character.personality.op("||")(cast(new_personality, JSONB))
+    if not values:
+        return
+    result = await session.execute(
+        update(Character).where(Character.id == character_id).values(**values)
+    )
+    if result.rowcount == 0:
+        raise ValueError(f"角色不存在: {character_id}")
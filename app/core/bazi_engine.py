@@ -0,0 +1,179 @@
+"""八字 (Bazi) engine: derive the four pillars from a birth time and analyze
+the五行 (five element) distribution and stem/branch interactions.
+
+The static lookup tables are flattened into small integer arrays at import
+time so the per-call work is integer indexing rather than repeated dict
+hashing on Chinese characters.
+"""
+
+import functools
+import types
+from datetime import datetime
+
+import numpy as np
+
+TIANGAN = ("甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸")
+DIZHI = ("子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥")
+
+WUXING = ("金", "木", "水", "火", "土")
+WX_TO_INT = {name: i for i, name in enumerate(WUXING)}
+
+TIANGAN_WUXING = {
+    "甲": "木", "乙": "木", "丙": "火", "丁": "火", "戊": "土",
+    "己": "土", "庚": "金", "辛": "金", "壬": "水", "癸": "水",
+}
+DIZHI_WUXING = {
+    "子": "水", "丑": "土", "寅": "木", "卯": "木", "辰": "土", "巳": "火",
+    "午": "火", "未": "土", "申": "金", "酉": "金", "戌": "土", "亥": "水",
+}
+
+# 天干五合 / 地支六合: pair -> resulting element.
+TIANGAN_HE = {
+    ("甲", "己"): "土", ("乙", "庚"): "金", ("丙", "辛"): "水",
+    ("丁", "壬"): "木", ("戊", "癸"): "火",
+}
+DIZHI_LIUHE = {
+    ("子", "丑"): "土", ("寅", "亥"): "木", ("卯", "戌"): "火",
+    ("辰", "酉"): "金", ("巳", "申"): "水", ("午", "未"): "土",
+}
+
+# 节气: term name -> approximate (month, day).
+JIEQI = {
+    "立春": (2, 4), "雨水": (2, 19), "惊蛰": (3, 6), "春分": (3, 21),
+    "清明": (4, 5), "谷雨": (4, 20), "立夏": (5, 6), "小满": (5, 21),
+    "芒种": (6, 6), "夏至": (6, 21), "小暑": (7, 7), "大暑": (7, 23),
+    "立秋": (8, 8), "处暑": (8, 23), "白露": (9, 8), "秋分": (9, 23),
+    "寒露": (10, 8), "霜降": (10, 24), "立冬": (11, 8), "小雪": (11, 22),
+    "大雪": (12, 7), "冬至": (12, 22), "小寒": (1, 6), "大寒": (1, 20),
+}
+
+# Import-time flattening: element of each stem/branch by index, and dense
+# interaction matrices (value = resulting element index, -1 = no relation).
+TG_IDX = {g: i for i, g in enumerate(TIANGAN)}
+DZ_IDX = {z: i for i, z in enumerate(DIZHI)}
+
+TG_WX_ARR = np.array([WX_TO_INT[TIANGAN_WUXING[g]] for g in TIANGAN], dtype=np.int8)
+DZ_WX_ARR = np.array([WX_TO_INT[DIZHI_WUXING[z]] for z in DIZHI], dtype=np.int8)
+
+HE_MATRIX = np.full((10, 10), -1, dtype=np.int8)
+for (_a, _b), _wx in TIANGAN_HE.items():
+    _i, _j = TIANGAN.index(_a), TIANGAN.index(_b)
+    HE_MATRIX[_i, _j] = HE_MATRIX[_j, _i] = WX_TO_INT[_wx]
+
+LIUHE_MATRIX = np.full((12, 12), -1, dtype=np.int8)
+for (_a, _b), _wx in DIZHI_LIUHE.items():
+    _i, _j = DIZHI.index(_a), DIZHI.index(_b)
+    LIUHE_MATRIX[_i, _j] = LIUHE_MATRIX[_j, _i] = WX_TO_INT[_wx]
+
+
+# Read-only view handed out by find_jieqi_in_year — no per-call copy.
+_JIEQI_FROZEN = types.MappingProxyType(JIEQI)
+
+
+def find_jieqi_in_year(year: int) -> types.MappingProxyType:
+    """Solar terms for a year (the table is static across years)."""
+    return _JIEQI_FROZEN
+
+
+PILLAR_NAMES = ("year", "month", "day", "hour")
+_PILLAR_PAIRS = ((0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3))
+
+
+def generate_bazi(birth_time: str) -> dict:
+    """Four pillars for a "YYYY-MM-DD HH:MM" birth time."""
+    return dict(zip(PILLAR_NAMES, _bazi_pillars(birth_time)))
+
+
+@functools.lru_cache(maxsize=65536)
+def _bazi_pillars(birth_time: str) -> tuple:
+    """Pure pillar computation, cached on the birth-time string."""
+    # fromisoformat is an order of magnitude faster than strptime's
+    # Python-level format parser; "YYYY-MM-DD HH:MM" only needs the space
+    # swapped for a "T".
+    dt = datetime.fromisoformat(birth_time.replace(" ", "T"))
+
+    year_tg = (dt.year - 4) % 10
+    year_dz = (dt.year - 4) % 12
+
+    month_dz = (dt.month + 1) % 12
+    month_tg = (year_tg * 2 + dt.month) % 10
+
+    days = (dt - datetime(1900, 1, 1)).days
+    day_tg = (days + 10) % 10
+    day_dz = (days + 12) % 12
+
+    hour_dz = ((dt.hour + 1) // 2) % 12
+    hour_tg = (day_tg * 2 + hour_dz) % 10
+
+    return (
+        TIANGAN[year_tg] + DIZHI[year_dz],
+        TIANGAN[month_tg] + DIZHI[month_dz],
+        TIANGAN[day_tg] + DIZHI[day_dz],
+        TIANGAN[hour_tg] + DIZHI[hour_dz],
+    )
+
+
+def analyze_wuxing_distribution(bazi_dict: dict) -> dict:
+    """Count the five elements across the eight characters and collect
+    合化 interactions between pillars."""
+    counts, interactions = _analyze_pillars(tuple(bazi_dict.values()))
+    return {"counts": dict(counts), "interactions": list(interactions)}
+
+
+@functools.lru_cache(maxsize=65536)
+def _analyze_pillars(pillar_tuple: tuple) -> tuple:
+    """Element counts and interactions for a pillar tuple, cached."""
+    # Decode each pillar into integer (stem, branch) indices once; the
+    # count and interaction passes then run on small ints only.
+    decoded = [(TG_IDX[p[0]], DZ_IDX[p[1]]) for p in pillar_tuple]
+    counts_arr = np.zeros(5, dtype=np.int8)
+    for tg_i, dz_i in decoded:
+        counts_arr[TG_WX_ARR[tg_i]] += 1
+        counts_arr[DZ_WX_ARR[dz_i]] += 1
+
+    # A bazi always has exactly 4 pillars -> 6 unique pairs; iterate them
+    # directly instead of walking 16 (i, j) combinations per pass.
+    interactions = []
+    for i, j in _PILLAR_PAIRS:
+        tg_i, dz_i = decoded[i]
+        tg_j, dz_j = decoded[j]
+        he = HE_MATRIX[tg_i, tg_j]
+        if he >= 0:
+            interactions.append(("天干合", TIANGAN[tg_i] + TIANGAN[tg_j], WUXING[he]))
+        liuhe = LIUHE_MATRIX[dz_i, dz_j]
+        if liuhe >= 0:
+            interactions.append(("地支六合", DIZHI[dz_i] + DIZHI[dz_j], WUXING[liuhe]))
+
+    counts = tuple((name, int(counts_arr[i])) for i, name in enumerate(WUXING))
+    return counts, tuple(interactions)
+
+
+def get_wuxing_bias(counts: dict) -> dict:
+    """Dominant and weakest element of a五行 count mapping."""
+    dominant = max(counts, key=counts.get)
+    weakest = min(counts, key=counts.get)
+    return {"dominant": dominant, "weakest": weakest}
+
+
+def analyze_character_fate(birth_time: str) -> dict:
+    """Full fate analysis: pillars, element distribution and bias.
+
+    Results are cached per birth-time string; the top-level dict is copied
+    per call so callers can attach keys, the nested values are shared and
+    must be treated as read-only.
+    """
+    return dict(_character_fate_cached(birth_time))
+
+
+@functools.lru_cache(maxsize=8192)
+def _character_fate_cached(birth_time: str) -> dict:
+    bazi = generate_bazi(birth_time)
+    distribution = analyze_wuxing_distribution(bazi)
+    bias = get_wuxing_bias(distribution["counts"])
+    return {
+        "bazi": bazi,
+        "wuxing_counts": distribution["counts"],
+        "interactions": distribution["interactions"],
+        "dominant": bias["dominant"],
+        "weakest": bias["weakest"],
+    }
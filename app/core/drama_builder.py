@@ -0,0 +1,52 @@
+"""命运剧场 (fate theater): turn a causal event chain into a script."""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.causal import CausalEvent
+from app.models.character import Character
+
+
+async def _load_causal_path(event_id: int, db: AsyncSession) -> list:
+    """Walk the cause chain from ``event_id`` back to the root event."""
+    path = []
+    result = await db.execute(select(CausalEvent).where(CausalEvent.id == event_id))
+    event = result.scalar_one_or_none()
+    while event is not None:
+        path.append(event)
+        if event.cause_id is None:
+            break
+        result = await db.execute(select(CausalEvent).where(CausalEvent.id == event.cause_id))
+        event = result.scalar_one_or_none()
+    path.reverse()
+    return path
+
+
+async def generate_fate_theater(event_id: int, db: AsyncSession) -> dict:
+    """Build the theater script for the causal chain ending at ``event_id``.
+
+    All characters appearing on the path are fetched with one awaited
+    ``WHERE id IN (...)`` query up front, so the script-building loop never
+    touches the database (or blocks the event loop).
+    """
+    path = await _load_causal_path(event_id, db)
+    if not path:
+        return {"event_id": event_id, "scenes": []}
+
+    ids = {e.actor_id for e in path} | {e.target_id for e in path if e.target_id}
+    result = await db.execute(select(Character).where(Character.id.in_(ids)))
+    chars = {c.id: c for c in result.scalars().all()}
+
+    scenes = []
+    for index, event in enumerate(path):
+        actor = chars.get(event.actor_id)
+        target = chars.get(event.target_id)
+        scenes.append({
+            "scene": index + 1,
+            "actor": actor.name if actor else "未知角色",
+            "target": target.name if target else None,
+            "action": event.action,
+            "line": event.description or f"{actor.name if actor else '某人'}选择了{event.action}",
+            "timestamp": event.timestamp,
+        })
+    return {"event_id": event_id, "scenes": scenes}
@@ -0,0 +1,186 @@
+"""命运引擎: score destiny events against a character's fate.
+
+The keyword tables live at module scope and feed an optional Aho-Corasick
+automaton so every event text is scanned in a single pass; without
+pyahocorasick the counting falls back to substring scans over the same
+tuples.
+"""
+
+import random
+import re
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+try:  # pyahocorasick is optional: keyword counting falls back to substring scans
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:  # pragma: no cover
+    HAS_AHOCORASICK = False
+
+from app.models.character import Character
+from app.models.destiny import DestinyNode
+
+# Polarity keyword tables — immutable and shared, never rebuilt per call.
+POSITIVE_KEYWORDS = ("成功", "获得", "突破", "胜利", "奇遇", "晋升", "康复")
+NEGATIVE_KEYWORDS = ("失败", "失去", "受伤", "背叛", "破财", "病重", "落败")
+CRITICAL_KEYWORDS = ("生死", "大劫", "姻缘", "天命")
+
+if HAS_AHOCORASICK:
+    _KEYWORD_AC = ahocorasick.Automaton()
+    for _polarity, _words in (("positive", POSITIVE_KEYWORDS),
+                              ("negative", NEGATIVE_KEYWORDS),
+                              ("critical", CRITICAL_KEYWORDS)):
+        for _word in _words:
+            _KEYWORD_AC.add_word(_word, _polarity)
+    _KEYWORD_AC.make_automaton()
+else:
+    _KEYWORD_AC = None
+
+# Fallback matchers: one compiled alternation per polarity keeps the scan
+# in sre's C loop instead of N Python-level substring searches.
+_POS_RE = re.compile("|".join(POSITIVE_KEYWORDS))
+_NEG_RE = re.compile("|".join(NEGATIVE_KEYWORDS))
+_CRITICAL_RE = re.compile("|".join(CRITICAL_KEYWORDS))
+
+
+# 相生 / 相克 as (dominant, current-month element) pairs — one hash probe
+# replaces the chained equality comparisons.
+_SHENG = frozenset((("水", "木"), ("木", "火"), ("火", "土"),
+                    ("土", "金"), ("金", "水")))
+_KE = frozenset((("水", "火"), ("火", "金"), ("金", "木"),
+                 ("木", "土"), ("土", "水")))
+
+EVENT_TYPE_IMPACTS = {
+    "机遇": 5.0, "事业": 3.0, "情感": 2.0, "健康": -2.0, "劫难": -5.0,
+}
+
+MONTH_WUXING = {
+    1: "水", 2: "木", 3: "土", 4: "木", 5: "火", 6: "土",
+    7: "火", 8: "金", 9: "土", 10: "金", 11: "水", 12: "土",
+}
+
+_RNG = np.random.default_rng()
+
+# Event types encoded as array indices for np.take; the trailing slot is
+# the zero impact for unknown types.
+_EVENT_TYPES = tuple(EVENT_TYPE_IMPACTS)
+_EVENT_TYPE_INDEX = {name: i for i, name in enumerate(_EVENT_TYPES)}
+_EVENT_IMPACT_ARR = np.array(
+    [EVENT_TYPE_IMPACTS[name] for name in _EVENT_TYPES] + [0.0]
+)
+
+
+def count_keywords(text: str) -> dict:
+    """Count positive/negative/critical keyword hits in one pass."""
+    counts = {"positive": 0, "negative": 0, "critical": 0}
+    if not text:
+        return counts
+    if _KEYWORD_AC is not None:
+        for _, polarity in _KEYWORD_AC.iter(text):
+            counts[polarity] += 1
+    else:
+        counts["positive"] = len(_POS_RE.findall(text))
+        counts["negative"] = len(_NEG_RE.findall(text))
+        counts["critical"] = len(_CRITICAL_RE.findall(text))
+    return counts
+
+
+def update_fate_score(character: Character, destiny_data: dict, *,
+                      current_month: int = None) -> float:
+    """Return the character's new fate score after a destiny event.
+
+    Hot loops pass ``current_month`` once instead of paying a clock read
+    per call.
+    """
+    if current_month is None:
+        current_month = datetime.now().month
+    text = (destiny_data.get("result") or "") + (destiny_data.get("consequence") or "")
+    counts = count_keywords(text)
+    result_score = (
+        counts["positive"] - counts["negative"] + 2.0 * counts["critical"]
+    )
+    base_impact = EVENT_TYPE_IMPACTS.get(destiny_data.get("event_type"), 0.0)
+
+    pair = (character.dominant_wuxing, MONTH_WUXING[current_month])
+    if pair in _SHENG:
+        fate_multiplier = 1.1  # 相生: the month feeds the character's element
+    elif pair in _KE:
+        fate_multiplier = 0.9  # 相克: the month works against it
+    else:
+        fate_multiplier = 1.0
+
+    final_impact = (result_score + base_impact) * fate_multiplier
+    final_impact *= random.uniform(0.9, 1.1)
+    return max(0.0, min(100.0, character.fate_score + final_impact))
+
+
+def update_fate_scores_batch(characters: list, events: list, *,
+                             current_month: int = None) -> np.ndarray:
+    """Vectorized :func:`update_fate_score` over parallel character/event lists.
+
+    The keyword scans stay in the automaton; everything numeric — event
+    impacts (via ``np.take``), wuxing multipliers, random factors and the
+    clamp — runs as array expressions, amortizing the per-call Python
+    overhead across the whole batch.
+    """
+    scores = np.array([c.fate_score for c in characters], dtype=np.float64)
+    if scores.size == 0:
+        return scores
+    counts = [
+        count_keywords((e.get("result") or "") + (e.get("consequence") or ""))
+        for e in events
+    ]
+    result_scores = np.array(
+        [c["positive"] - c["negative"] + 2.0 * c["critical"] for c in counts],
+        dtype=np.float64,
+    )
+    unknown = len(_EVENT_TYPES)
+    type_idx = np.array(
+        [_EVENT_TYPE_INDEX.get(e.get("event_type"), unknown) for e in events]
+    )
+    base = _EVENT_IMPACT_ARR.take(type_idx)
+    if current_month is None:
+        current_month = datetime.now().month
+    current = MONTH_WUXING[current_month]
+    multipliers = np.array([
+        1.1 if (c.dominant_wuxing, current) in _SHENG
+        else 0.9 if (c.dominant_wuxing, current) in _KE
+        else 1.0
+        for c in characters
+    ])
+    final = (result_scores + base) * multipliers
+    final *= _RNG.uniform(0.9, 1.1, size=scores.shape[0])
+    return np.clip(scores + final, 0.0, 100.0)
+
+
+async def predict_character_trend(character_id: int, db: AsyncSession) -> dict:
+    """Project the fate trend from the character's five latest events."""
+    result = await db.execute(
+        select(DestinyNode.result, DestinyNode.consequence)
+        .where(DestinyNode.character_id == character_id)
+        .order_by(DestinyNode.timestamp.desc())
+        .limit(5)
+    )
+    rows = result.all()
+    positive = 0
+    negative = 0
+    for res, consequence in rows:
+        counts = count_keywords((res or "") + (consequence or ""))
+        positive += counts["positive"] + 2 * counts["critical"]
+        negative += counts["negative"]
+    if positive > negative:
+        trend = "上升"
+    elif negative > positive:
+        trend = "下降"
+    else:
+        trend = "平稳"
+    return {
+        "character_id": character_id,
+        "trend": trend,
+        "positive": positive,
+        "negative": negative,
+        "window": len(rows),
+    }
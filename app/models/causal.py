@@ -0,0 +1,20 @@
+"""Causal event chain ORM model used by the fate theater."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
+
+from app.database import Base
+
+
+class CausalEvent(Base):
+    __tablename__ = "causal_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cause_id = Column(Integer, ForeignKey("causal_events.id"), nullable=True)
+    actor_id = Column(Integer, ForeignKey("characters.id"), nullable=False)
+    target_id = Column(Integer, ForeignKey("characters.id"), nullable=True)
+    action = Column(String(64), nullable=False)
+    description = Column(Text, default="")
+    payload = Column(JSON, default=dict)
+    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
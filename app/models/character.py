@@ -0,0 +1,87 @@
+"""Character ORM model."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+
+
+class Character(Base):
+    __tablename__ = "characters"
+    __table_args__ = (
+        Index("ix_character_user_name", "user_id", "name"),
+        # Trigram GIN index so the %name% ilike filter in the listing
+        # endpoint stays an index scan. Requires: CREATE EXTENSION pg_trgm.
+        Index(
+            "ix_character_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    name = Column(String(64), nullable=False)
+    birth_time = Column(String(16), nullable=False)  # "YYYY-MM-DD HH:MM"
+    dominant_wuxing = Column(String(4))
+    fate_score = Column(Float, default=50.0)
+    # JSONB (not JSON): the ai_db_utils partial-update path merges these
+    # server-side with the jsonb || operator.
+    attributes = Column(JSONB, default=dict)   # physique / intelligence / emotion / social
+    personality = Column(JSONB, default=dict)  # OCEAN, each in [0, 1]
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    last_simulation_date = Column(DateTime)
+
+    destiny_nodes = relationship("DestinyNode", back_populates="character")
+    relationships_source = relationship(
+        "Relationship", foreign_keys="Relationship.source_id", back_populates="source"
+    )
+    relationships_target = relationship(
+        "Relationship", foreign_keys="Relationship.target_id", back_populates="target"
+    )
+
+    def to_profile(self) -> dict:
+        """Profile dict consumed by the RL side (see app.ai.utils.build_state).
+
+        Memoized on the instance keyed by ``updated_at``: hot characters get
+        simulated repeatedly between edits, so the dict is rebuilt only when
+        the row actually changed. Callers must treat the result as read-only.
+        """
+        cached = self.__dict__.get("_profile_cache")
+        if cached is not None and cached[0] == self.updated_at:
+            return cached[1]
+        profile = self._build_profile()
+        # Plain __dict__ entry: not a mapped column, so SQLAlchemy ignores it.
+        self.__dict__["_profile_cache"] = (self.updated_at, profile)
+        return profile
+
+    def _build_profile(self) -> dict:
+        profile = dict(self.personality or {})
+        profile["attributes"] = dict(self.attributes or {})
+        profile["wuxing"] = {self.dominant_wuxing: 1.0} if self.dominant_wuxing else {}
+        profile["emotion_state"] = {"joy": 0.5, "anger": 0.0, "sadness": 0.0, "fear": 0.0}
+        profile["trust"] = 0.5
+        return profile
+
+
+class Relationship(Base):
+    __tablename__ = "relationships"
+
+    id = Column(Integer, primary_key=True, index=True)
+    source_id = Column(Integer, ForeignKey("characters.id"), nullable=False, index=True)
+    target_id = Column(Integer, ForeignKey("characters.id"), nullable=False, index=True)
+    relation_type = Column(String(32), nullable=False)
+    strength = Column(Float, default=0.5)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    source = relationship(
+        "Character", foreign_keys=[source_id], back_populates="relationships_source"
+    )
+    target = relationship(
+        "Character", foreign_keys=[target_id], back_populates="relationships_target"
+    )
@@ -0,0 +1,42 @@
+"""Destiny event tree ORM model."""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+
+
+class DestinyNode(Base):
+    __tablename__ = "destiny_nodes"
+    # Covering indexes for the history/tree filter paths, matching the
+    # ORDER BY timestamp DESC the router uses.
+    __table_args__ = (
+        Index("ix_destiny_char_ts_desc", "character_id", text("timestamp DESC")),
+        Index("ix_destiny_char_type_ts", "character_id", "event_type", text("timestamp DESC")),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    character_id = Column(Integer, ForeignKey("characters.id"), nullable=False, index=True)
+    parent_id = Column(Integer, ForeignKey("destiny_nodes.id"), nullable=True)
+    event_type = Column(String(32), nullable=False)
+    description = Column(Text, default="")
+    result = Column(Text, default="")
+    consequence = Column(Text, default="")
+    fate_impact = Column(Float, default=0.0)
+    is_critical = Column(Boolean, default=False)
+    timestamp = Column(DateTime, default=datetime.utcnow)
+
+    character = relationship("Character", back_populates="destiny_nodes")
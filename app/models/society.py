@@ -0,0 +1,85 @@
+"""社会模拟 ORM models: 政权、社会阶层与社会事件."""
+
+from datetime import datetime
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    text,
+)
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+
+
+class Regime(Base):
+    __tablename__ = "regime"
+    __table_args__ = (
+        # Serves the ubiquitous ORDER BY timestamp DESC LIMIT 1 lookup.
+        Index("ix_regime_timestamp_desc", text("timestamp DESC")),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(64), nullable=False)
+    regime_type = Column(String(32), nullable=False)  # 君主制 / 共和制 / ...
+    satisfaction = Column(Float, default=0.5)
+    corruption = Column(Float, default=0.2)
+    stability = Column(Float, default=0.7)
+    prosperity = Column(Float, default=0.5)
+    freedom = Column(Float, default=0.5)
+    timestamp = Column(DateTime, default=datetime.utcnow)
+
+    events = relationship("SocialEvent", back_populates="regime")
+    social_classes = relationship("SocialClass", back_populates="regime")
+
+
+class SocialClass(Base):
+    __tablename__ = "social_class"
+
+    id = Column(Integer, primary_key=True, index=True)
+    regime_id = Column(Integer, ForeignKey("regime.id"), nullable=False, index=True)
+    name = Column(String(32), nullable=False)  # 统治阶层 / 中产阶级 / 底层民众
+    population = Column(Float, default=0.3)    # share of total population
+    wealth = Column(Float, default=0.5)
+    happiness = Column(Float, default=0.5)
+    education = Column(Float, default=0.5)
+    mobility = Column(Float, default=0.3)
+
+    regime = relationship("Regime", back_populates="social_classes")
+
+
+class SocialEvent(Base):
+    __tablename__ = "social_event"
+    __table_args__ = (
+        Index("ix_social_event_regime_time", "regime_id", text("timestamp DESC")),
+        Index("ix_social_event_regime_active", "regime_id", "is_active"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    regime_id = Column(Integer, ForeignKey("regime.id"), nullable=False, index=True)
+    name = Column(String(64), nullable=False)
+    event_type = Column(String(32), nullable=False)  # 革命 / 改革 / 战争 / 灾难 / 繁荣
+    description = Column(String(256), default="")
+    impact = Column(JSON, default=dict)  # regime field -> delta
+    duration = Column(Integer, default=30)
+    is_active = Column(Boolean, default=True)
+    timestamp = Column(DateTime, default=datetime.utcnow)
+
+    regime = relationship("Regime", back_populates="events")
+
+
+class SocialClassEvent(Base):
+    __tablename__ = "social_class_event"
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(Integer, ForeignKey("social_event.id"), nullable=False, index=True)
+    class_id = Column(Integer, ForeignKey("social_class.id"), nullable=False, index=True)
+    impact = Column(Float, default=0.0)
+    timestamp = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,96 @@
+"""PvP 对决 environment: a two-character duel stepped one action at a time.
+
+Duel state is held as a ``(2, STATE_DIM)`` float32 array — the static
+profile portions are packed once at construction and ``step`` mutates the
+emotion/trust slices in place, so the hot loop never touches the profile
+dicts. Dicts are only synced back on :meth:`export_profiles`.
+"""
+
+import gymnasium as gym
+import numpy as np
+
+from app.ai.utils import (
+    ACTION_NAMES,
+    EMO_OFF,
+    EMOTIONS,
+    STATE_DIM,
+    TRUST_OFF,
+    build_state,
+    compute_reward,
+)
+
+_JOY = EMO_OFF
+_ANGER = EMO_OFF + 1
+_SADNESS = EMO_OFF + 2
+_FEAR = EMO_OFF + 3
+
+
+class PvPArenaEnv(gym.Env):
+    """Single duel between two character profiles, turns alternating."""
+
+    def __init__(self, profile1: dict, profile2: dict, max_turns: int = 20):
+        super().__init__()
+        self.profiles = [profile1, profile2]
+        self.max_turns = max_turns
+        self.turn = 0
+        self.current = 0
+        self._state = np.empty((2, STATE_DIM), dtype=np.float32)
+        build_state(profile1, out=self._state[0])
+        build_state(profile2, out=self._state[1])
+        self._initial = self._state.copy()
+        # Persistent per-player observation views: step/reset hand these out
+        # instead of slicing a fresh ndarray view object on every transition.
+        self._obs = (self._state[0], self._state[1])
+        self.action_space = gym.spaces.Discrete(len(ACTION_NAMES))
+        self.observation_space = gym.spaces.Box(
+            low=0.0, high=1.0, shape=(STATE_DIM,), dtype=np.float32
+        )
+
+    def reset(self, *, seed=None, options=None):
+        super().reset(seed=seed)
+        self.turn = 0
+        self.current = 0
+        np.copyto(self._state, self._initial)
+        self._state[:, _JOY] = 0.5
+        self._state[:, _ANGER:_FEAR + 1] = 0.0
+        self._state[:, TRUST_OFF] = 0.5
+        return self._obs[0], {}
+
+    def step(self, action: int):
+        actor, other = self.current, 1 - self.current
+        state = self._state
+        if action == 0:      # 攻击
+            state[other, _ANGER] += 0.1
+            state[other, _FEAR] += 0.05
+            state[actor, _JOY] -= 0.02
+        elif action == 1:    # 防御
+            state[actor, _FEAR] -= 0.05
+        elif action == 2:    # 挑衅
+            state[other, _ANGER] += 0.15
+            state[actor, _JOY] += 0.02
+        elif action == 3:    # 安抚
+            state[other, _ANGER] -= 0.1
+            state[other, _JOY] += 0.05
+        elif action == 4:    # 合作
+            state[:, _JOY] += 0.05
+            state[:, TRUST_OFF] += 0.05
+        else:                # 退让
+            state[actor, _SADNESS] += 0.05
+            state[other, _ANGER] -= 0.05
+        np.clip(state[:, _JOY:_FEAR + 1], 0.0, 1.0, out=state[:, _JOY:_FEAR + 1])
+        np.clip(state[:, TRUST_OFF], 0.0, 1.0, out=state[:, TRUST_OFF])
+
+        reward = compute_reward(state[actor], action)
+        self.turn += 1
+        self.current = other
+        truncated = self.turn >= self.max_turns
+        return self._obs[other], reward, False, truncated, {}
+
+    def export_profiles(self) -> list:
+        """Sync the array state back into the profile dicts and return them."""
+        for i, profile in enumerate(self.profiles):
+            profile["emotion_state"] = {
+                key: float(self._state[i, EMO_OFF + j]) for j, key in enumerate(EMOTIONS)
+            }
+            profile["trust"] = float(self._state[i, TRUST_OFF])
+        return self.profiles
@@ -0,0 +1,95 @@
+"""Batched PvP arena: N duels stepped in lock-step as struct-of-arrays state.
+
+The whole duel state lives in one ``(N, 2, STATE_DIM)`` float32 tensor —
+the static profile portions are packed once at construction and only the
+emotion/trust slices mutate during play, via boolean-mask updates instead of
+per-duel Python branching.
+"""
+
+import numpy as np
+
+from app.ai.utils import (
+    EMO_OFF,
+    STATE_DIM,
+    TRUST_OFF,
+    build_state,
+    compute_reward_batch,
+)
+
+_JOY = EMO_OFF
+_ANGER = EMO_OFF + 1
+_SADNESS = EMO_OFF + 2
+_FEAR = EMO_OFF + 3
+
+
+class BatchPvPEnv:
+    """N simultaneous duels behind a gymnasium-style vectorized step(actions).
+
+    Follows the VectorEnv protocol shape: batched observations in/out and
+    (obs, rewards, terminated, truncated, info) from step, with autoreset.
+    """
+
+    def __init__(self, profile_pairs, max_turns: int = 20):
+        self.num_envs = len(profile_pairs)
+        self.max_turns = max_turns
+        self._state = np.empty((self.num_envs, 2, STATE_DIM), dtype=np.float32)
+        for i, (p1, p2) in enumerate(profile_pairs):
+            build_state(p1, out=self._state[i, 0])
+            build_state(p2, out=self._state[i, 1])
+        self._initial = self._state.copy()
+        self.turn = np.zeros(self.num_envs, dtype=np.int8)   # whose move, 0/1
+        self.steps = np.zeros(self.num_envs, dtype=np.int32)
+        self._idx = np.arange(self.num_envs)
+
+    def reset(self) -> np.ndarray:
+        np.copyto(self._state, self._initial)
+        self.turn[:] = 0
+        self.steps[:] = 0
+        return self._state[self._idx, self.turn]
+
+    def step(self, actions: np.ndarray):
+        """Advance all N duels with one ``(N,)`` action vector."""
+        state = self._state
+        idx = self._idx
+        actor, other = self.turn, 1 - self.turn
+
+        mask = actions == 0  # 攻击
+        state[idx[mask], other[mask], _ANGER] += 0.1
+        state[idx[mask], other[mask], _FEAR] += 0.05
+        state[idx[mask], actor[mask], _JOY] -= 0.02
+
+        mask = actions == 1  # 防御
+        state[idx[mask], actor[mask], _FEAR] -= 0.05
+
+        mask = actions == 2  # 挑衅
+        state[idx[mask], other[mask], _ANGER] += 0.15
+        state[idx[mask], actor[mask], _JOY] += 0.02
+
+        mask = actions == 3  # 安抚
+        state[idx[mask], other[mask], _ANGER] -= 0.1
+        state[idx[mask], other[mask], _JOY] += 0.05
+
+        mask = actions == 4  # 合作
+        state[idx[mask], :, _JOY] += 0.05
+        state[idx[mask], :, TRUST_OFF] += 0.05
+
+        mask = actions == 5  # 退让
+        state[idx[mask], actor[mask], _SADNESS] += 0.05
+        state[idx[mask], other[mask], _ANGER] -= 0.05
+
+        np.clip(state[:, :, _JOY:_FEAR + 1], 0.0, 1.0, out=state[:, :, _JOY:_FEAR + 1])
+        np.clip(state[:, :, TRUST_OFF], 0.0, 1.0, out=state[:, :, TRUST_OFF])
+
+        rewards = compute_reward_batch(state[idx, actor], actions)
+        self.steps += 1
+        self.turn = other
+        truncated = self.steps >= self.max_turns
+        terminated = np.zeros(self.num_envs, dtype=np.bool_)
+
+        if truncated.any():  # autoreset finished duels
+            done_idx = idx[truncated]
+            self._state[done_idx] = self._initial[done_idx]
+            self.turn[truncated] = 0
+            self.steps[truncated] = 0
+
+        return self._state[idx, self.turn], rewards, terminated, truncated, {}
@@ -0,0 +1,29 @@
+"""Turn-by-turn duel log.
+
+Entries are stored fully formed at record time (the method is ``record``,
+not ``log``, so it can never shadow the entry list), which makes ``export``
+a plain list return instead of a per-entry copy/reprocess pass.
+"""
+
+from app.ai.utils import ACTION_NAMES
+
+
+class DuelLogger:
+    def __init__(self):
+        self.entries = []
+
+    def record(self, turn: int, action: int, reward: float, actor_name: str = None):
+        action_name = ACTION_NAMES[action] if 0 <= action < len(ACTION_NAMES) else "未知"
+        self.entries.append({
+            "turn": turn,
+            "action": action,
+            "action_name": action_name,
+            "reward": reward,
+            "actor": actor_name,
+        })
+
+    def export(self) -> list:
+        return self.entries
+
+    def clear(self):
+        self.entries.clear()
@@ -0,0 +1,133 @@
+"""Character CRUD endpoints."""
+
+from typing import Optional
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth import get_current_user
+from app.core.bazi_engine import analyze_character_fate
+from app.database import get_async_db
+from app.models.character import Character
+from app.models.user import User
+from app.schemas.character import CharacterCreate, CharacterOut, CharacterPage
+
+router = APIRouter(prefix="/characters", tags=["characters"])
+
+# Shared module-level generator: attribute/personality randomization draws
+# in two vectorized calls instead of ~9 separate random.* calls.
+_rng = np.random.default_rng()
+
+_ATTR_KEYS = ("physique", "intelligence", "emotion", "social")
+_OCEAN_KEYS = ("O", "C", "E", "A", "N")
+
+# 五行 -> OCEAN personality delta, key order O/C/E/A/N.
+_ZERO5 = np.zeros(5, dtype=np.float32)
+_DOMINANT_DELTAS = {
+    "木": np.array([0.2, -0.1, 0.0, 0.0, 0.0], dtype=np.float32),
+    "火": np.array([0.0, 0.0, 0.2, 0.0, 0.1], dtype=np.float32),
+    "土": np.array([0.0, 0.2, 0.0, 0.0, -0.1], dtype=np.float32),
+    "金": np.array([0.0, 0.1, 0.0, -0.1, 0.0], dtype=np.float32),
+    "水": np.array([0.1, 0.0, 0.0, 0.1, 0.0], dtype=np.float32),
+}
+
+
+@router.post("/", response_model=CharacterOut)
+async def create_character(
+    data: CharacterCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    fate = analyze_character_fate(data.birth_time)
+    dominant = fate["dominant"]
+
+    weights = np.array(
+        [data.physique_weight, data.intelligence_weight,
+         data.emotion_weight, data.social_weight],
+        dtype=np.float32,
+    )
+    raw_attr = _rng.integers(1, 11, size=4)
+    attr_values = np.clip(raw_attr * weights, 1, 10).round().astype(int)
+    attributes = dict(zip(_ATTR_KEYS, (int(v) for v in attr_values)))
+
+    base = np.full(5, 0.5, dtype=np.float32)
+    base += _DOMINANT_DELTAS.get(dominant, _ZERO5)
+    noise = (_rng.random(5).astype(np.float32) - 0.5) * 0.4
+    personality_values = np.clip(base + noise, 0.0, 1.0)
+    personality = dict(zip(_OCEAN_KEYS, (float(v) for v in personality_values)))
+
+    character = Character(
+        user_id=current_user.id,
+        name=data.name,
+        birth_time=data.birth_time,
+        dominant_wuxing=dominant,
+        fate_score=50.0,
+        attributes=attributes,
+        personality=personality,
+    )
+    db.add(character)
+    await db.commit()
+    await db.refresh(character)
+    return character
+
+
+@router.get("/", response_model=CharacterPage)
+async def get_characters(
+    after_id: Optional[int] = None,
+    limit: int = 10,
+    name: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Keyset-paginated listing: pass the returned next_after_id to get the
+    next page. Unlike OFFSET, deep pages stay index-range scans."""
+    query = select(Character).where(Character.user_id == current_user.id)
+    if name:
+        query = query.where(Character.name.ilike(f"%{name}%"))
+    if after_id is not None:
+        query = query.where(Character.id > after_id)
+    result = await db.execute(query.order_by(Character.id).limit(limit))
+    rows = result.scalars().all()
+    return {
+        "items": rows,
+        "next_after_id": rows[-1].id if len(rows) == limit else None,
+    }
+
+
+@router.get("/{character_id}", response_model=CharacterOut)
+async def get_character(
+    character_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    result = await db.execute(
+        select(Character).where(
+            Character.id == character_id, Character.user_id == current_user.id
+        )
+    )
+    character = result.scalar_one_or_none()
+    if character is None:
+        raise HTTPException(status_code=404, detail="角色不存在")
+    return character
+
+
+@router.delete("/{character_id}", status_code=204)
+async def delete_character(
+    character_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    result = await db.execute(
+        select(Character).where(
+            Character.id == character_id, Character.user_id == current_user.id
+        )
+    )
+    character = result.scalar_one_or_none()
+    if character is None:
+        raise HTTPException(status_code=404, detail="角色不存在")
+    await db.delete(character)
+    await db.commit()
+    # 204: no body — returning one only makes Starlette serialize and strip it.
+    return None
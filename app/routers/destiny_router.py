@@ -0,0 +1,274 @@
+"""Destiny event endpoints: history, tree, predictions and CRUD."""
+
+import functools
+import random
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.auth import get_current_user
+from app.database import get_async_db
+from app.models.character import Character
+from app.models.destiny import DestinyNode
+from app.models.user import User
+from app.schemas.destiny import (
+    CharacterWithEvents,
+    CharacterWithRelationships,
+    DestinyNodeCreate,
+    DestinyNodeOut,
+    DestinyNodeUpdate,
+    RelationshipOut,
+)
+
+router = APIRouter(prefix="/destiny", tags=["destiny"])
+
+
+async def _get_owned_character(db: AsyncSession, character_id: int, user_id: int,
+                               options=()) -> Character:
+    query = select(Character).where(
+        Character.id == character_id, Character.user_id == user_id
+    )
+    if options:
+        query = query.options(*options)
+    result = await db.execute(query)
+    character = result.scalar_one_or_none()
+    if character is None:
+        raise HTTPException(status_code=404, detail="角色不存在")
+    return character
+
+
+@router.get("/characters/{character_id}/events", response_model=CharacterWithEvents)
+async def get_character_events(
+    character_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    character = await _get_owned_character(
+        db, character_id, current_user.id,
+        options=(selectinload(Character.destiny_nodes),),
+    )
+    # model_validate projects straight off the ORM instance — no throwaway
+    # dict copy and no _sa_instance_state leaking into serialization.
+    payload = CharacterWithEvents.model_validate(character)
+    payload.destiny_nodes.sort(key=lambda e: e.timestamp)
+    return payload
+
+
+@router.get("/characters/{character_id}/relationships",
+            response_model=CharacterWithRelationships)
+async def get_character_relationships(
+    character_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    character = await _get_owned_character(
+        db, character_id, current_user.id,
+        options=(
+            selectinload(Character.relationships_source),
+            selectinload(Character.relationships_target),
+        ),
+    )
+    payload = CharacterWithRelationships.model_validate(character)
+    # chain() iterates both collections without materializing a merged copy.
+    payload.relationships = [
+        RelationshipOut.model_validate(r)
+        for r in chain(character.relationships_source, character.relationships_target)
+    ]
+    return payload
+
+
+@router.get("/characters/{character_id}/tree")
+async def get_destiny_tree(
+    character_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Whole destiny tree in one query; the root is found in Python rather
+    than with a second query over the same table."""
+    await _get_owned_character(db, character_id, current_user.id)
+    result = await db.execute(
+        select(DestinyNode)
+        .where(DestinyNode.character_id == character_id)
+        .order_by(DestinyNode.timestamp.asc())
+    )
+    events = result.scalars().all()
+    root_id = next((e.id for e in events if e.parent_id is None), None)
+    children = {}
+    for event in events:
+        # orjson only accepts str dict keys — "root" stands in for the
+        # None parent of root nodes, int parents are stringified.
+        key = "root" if event.parent_id is None else str(event.parent_id)
+        children.setdefault(key, []).append(event.id)
+    return {
+        "character_id": character_id,
+        "root_id": root_id,
+        "nodes": [DestinyNodeOut.model_validate(e) for e in events],
+        "children": children,
+    }
+
+
+@router.get("/characters/{character_id}/history", response_model=List[DestinyNodeOut])
+async def get_destiny_history(
+    character_id: int,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    event_type: Optional[str] = None,
+    is_critical: Optional[bool] = None,
+    skip: int = 0,
+    limit: int = 50,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    await _get_owned_character(db, character_id, current_user.id)
+    query = select(DestinyNode).where(DestinyNode.character_id == character_id)
+    if start_date:
+        query = query.where(
+            DestinyNode.timestamp >= datetime.fromisoformat(start_date)
+        )
+    if end_date:
+        # Half-open range: < end + 1 day is index-friendly and avoids the
+        # 23:59:59 replace() dance.
+        end = datetime.fromisoformat(end_date) + timedelta(days=1)
+        query = query.where(DestinyNode.timestamp < end)
+    if event_type:
+        query = query.where(DestinyNode.event_type == event_type)
+    if is_critical is not None:
+        query = query.where(DestinyNode.is_critical == is_critical)
+    result = await db.execute(
+        query.order_by(DestinyNode.timestamp.desc()).offset(skip).limit(limit)
+    )
+    return result.scalars().all()
+
+
+@router.post("/events", response_model=DestinyNodeOut)
+async def record_destiny_event(
+    data: DestinyNodeCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    await _get_owned_character(db, data.character_id, current_user.id)
+    # One INSERT .. RETURNING plus one server-side UPDATE — no ORM flush
+    # round-trip and no post-commit refresh SELECT.
+    result = await db.execute(
+        insert(DestinyNode).values(**data.model_dump()).returning(DestinyNode)
+    )
+    destiny = result.scalar_one()
+    await db.execute(
+        update(Character)
+        .where(Character.id == data.character_id)
+        .values(
+            fate_score=func.greatest(
+                0.0, func.least(100.0, Character.fate_score + data.fate_impact)
+            )
+        )
+    )
+    await db.commit()
+    return destiny
+
+
+async def _get_owned_event(db: AsyncSession, event_id: int, user_id: int) -> DestinyNode:
+    """Fetch an event and enforce ownership in one JOINed query."""
+    result = await db.execute(
+        select(DestinyNode)
+        .join(Character, Character.id == DestinyNode.character_id)
+        .where(DestinyNode.id == event_id, Character.user_id == user_id)
+    )
+    event = result.scalar_one_or_none()
+    if event is None:
+        raise HTTPException(status_code=404, detail="事件不存在或无权访问")
+    return event
+
+
+@router.get("/events/{event_id}", response_model=DestinyNodeOut)
+async def get_destiny_event(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    return await _get_owned_event(db, event_id, current_user.id)
+
+
+@router.put("/events/{event_id}", response_model=DestinyNodeOut)
+async def update_destiny_event(
+    event_id: int,
+    data: DestinyNodeUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    event = await _get_owned_event(db, event_id, current_user.id)
+    for field, value in data.model_dump(exclude_unset=True).items():
+        setattr(event, field, value)
+    await db.commit()
+    await db.refresh(event)
+    return event
+
+
+@router.delete("/events/{event_id}", status_code=204)
+async def delete_destiny_event(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    event = await _get_owned_event(db, event_id, current_user.id)
+    await db.delete(event)
+    await db.commit()
+    return None
+
+
+@router.get("/events/{event_id}/predictions")
+async def predict_destiny_paths(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    result = await db.execute(
+        select(DestinyNode, Character)
+        .join(Character, Character.id == DestinyNode.character_id)
+        .where(DestinyNode.id == event_id, Character.user_id == current_user.id)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="事件不存在或无权访问")
+    event, character = row
+
+    personality = character.personality or {}
+    key = tuple(round(personality.get(k, 0.5), 2) for k in ("O", "C", "E", "A"))
+    possible_paths = _paths_for(event.event_type, key)
+    if possible_paths is None:
+        # Unknown event type: stochastic fallback, deliberately uncached.
+        possible_paths = [
+            {"path": "顺其自然", "probability": random.uniform(0.3, 0.6)},
+            {"path": "逆流而上", "probability": random.uniform(0.2, 0.5)},
+        ]
+    return {"event_id": event_id, "paths": possible_paths}
+
+
+@functools.lru_cache(maxsize=4096)
+def _paths_for(event_type: str, pers: tuple):
+    """Deterministic path candidates keyed by event type and the rounded
+    (O, C, E, A) personality tuple; None for unknown event types."""
+    o, c, e, a = pers
+    if event_type == "机遇":
+        return [
+            {"path": "把握机会", "probability": 0.4 + e * 0.2},
+            {"path": "谨慎观望", "probability": 0.3 + c * 0.2},
+            {"path": "错失良机", "probability": 0.2},
+        ]
+    if event_type == "劫难":
+        return [
+            {"path": "化险为夷", "probability": 0.3 + c * 0.2},
+            {"path": "损失惨重", "probability": 0.3},
+            {"path": "因祸得福", "probability": 0.15 + o * 0.1},
+        ]
+    if event_type == "姻缘":
+        return [
+            {"path": "喜结良缘", "probability": 0.35 + a * 0.2},
+            {"path": "有缘无分", "probability": 0.3},
+            {"path": "平淡收场", "probability": 0.2},
+        ]
+    return None
@@ -0,0 +1,46 @@
+"""开发用 mock 接口: canned payloads for services the frontend expects.
+
+The payloads are static, so each one is orjson-encoded once at import and
+served as raw bytes — no per-request serialization at all.
+"""
+
+import orjson
+from fastapi import APIRouter, Response
+
+router = APIRouter(prefix="/mock", tags=["mock"])
+
+_MEDIA_TYPE = "application/json"
+
+_ALMANAC = orjson.dumps({
+    "date": "甲辰年 丙寅月 庚午日",
+    "suitable": ["祭祀", "出行", "结盟"],
+    "avoid": ["动土", "开市"],
+    "luck": "中吉",
+})
+
+_CELESTIAL = orjson.dumps({
+    "phenomenon": "荧惑守心",
+    "omen": "大凶",
+    "affected_wuxing": ["火", "金"],
+})
+
+_ORACLE = orjson.dumps({
+    "hexagram": "乾",
+    "lines": [1, 1, 1, 1, 1, 1],
+    "judgement": "元亨利贞",
+})
+
+
+@router.get("/almanac")
+def get_almanac():
+    return Response(content=_ALMANAC, media_type=_MEDIA_TYPE)
+
+
+@router.get("/celestial")
+def get_celestial():
+    return Response(content=_CELESTIAL, media_type=_MEDIA_TYPE)
+
+
+@router.get("/oracle")
+def get_oracle():
+    return Response(content=_ORACLE, media_type=_MEDIA_TYPE)
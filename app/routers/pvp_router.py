@@ -0,0 +1,44 @@
+"""PvP duel endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth import get_current_user
+from app.database import get_async_db
+from app.models.character import Character
+from app.models.user import User
+from app.pvp_arena.arena_engine import simulate_duel
+
+router = APIRouter(prefix="/pvp", tags=["pvp"])
+
+
+class DuelRequest(BaseModel):
+    character_id_1: int
+    character_id_2: int
+    rounds: int = 10
+
+
+@router.post("/duel")
+async def run_character_duel(
+    data: DuelRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    result = await db.execute(
+        select(Character).where(
+            Character.id.in_([data.character_id_1, data.character_id_2]),
+            Character.user_id == current_user.id,
+        )
+    )
+    chars = {c.id: c for c in result.scalars().all()}
+    char1 = chars.get(data.character_id_1)
+    char2 = chars.get(data.character_id_2)
+    if char1 is None or char2 is None:
+        raise HTTPException(status_code=404, detail="角色不存在")
+
+    duel = simulate_duel(char1.to_profile(), char2.to_profile(), rounds=data.rounds)
+    names = {0: char1.name, 1: char2.name}
+    duel["winner_name"] = names.get(duel["winner"])
+    return duel
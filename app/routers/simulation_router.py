@@ -0,0 +1,465 @@
+"""模拟 endpoints: PPO-driven character behaviour, interaction and training."""
+
+import collections
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import orjson
+import torch
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.ai.character_env import (
+    CharacterEnvironment,
+    VectorCharacterEnvironment,
+    create_interaction_environment,
+)
+from app.ai.ppo_agent import PPOAgent
+from app.ai.utils import STATE_DIM
+from app.auth import get_current_user
+from app.database import get_db
+from app.models.character import Character
+from app.models.destiny import DestinyNode
+from app.models.user import User
+
+router = APIRouter(prefix="/simulation", tags=["simulation"])
+
+MODEL_DIR = os.environ.get("MODEL_DIR", "models")
+
+# Opt-in: torch.compile(mode="reduce-overhead") captures the tiny fixed-shape
+# policy forward into CUDA Graphs, which pays off on per-step rollouts.
+COMPILE_POLICY = bool(os.environ.get("COMPILE_POLICY"))
+
+# Shapes whose compiled policy artifact already exists in Dynamo's cache;
+# agents are per-character but the network shape is shared game-wide.
+_COMPILED_SHAPES = set()
+
+# LRU, bounded by resident parameter bytes rather than entry count — under
+# multi-tenant traffic an unbounded per-character dict leaks model memory.
+AGENT_CACHE = collections.OrderedDict()
+_AGENT_CACHE_LOCK = threading.Lock()
+AGENT_CACHE_MAX_BYTES = int(
+    os.environ.get("AGENT_CACHE_MAX_BYTES", 512 * 1024 * 1024)
+)
+
+
+class SimulationRequest(BaseModel):
+    steps: int = 20
+    scenario: str = ""
+    deterministic: bool = False
+
+
+class InteractionRequest(BaseModel):
+    character_id_1: int
+    character_id_2: int
+    scenario: str = ""
+    rounds: int = 10
+    rollouts: int = 1
+
+
+class TrainRequest(BaseModel):
+    episodes: int = 10
+    steps_per_episode: int = 200
+
+
+_EXISTS_TTL = 30.0
+_exists_cache = {}
+
+
+def _model_exists(path: str) -> bool:
+    """os.path.exists with a short TTL — repeat cache misses for characters
+    that have never been trained otherwise stat the filesystem per request."""
+    now = time.monotonic()
+    hit = _exists_cache.get(path)
+    if hit is not None and now - hit[1] < _EXISTS_TTL:
+        return hit[0]
+    exists = os.path.exists(path)
+    _exists_cache[path] = (exists, now)
+    return exists
+
+
+def _save_agent(agent: PPOAgent, model_path: str, character_id: int) -> None:
+    os.makedirs(MODEL_DIR, exist_ok=True)
+    agent.save_model(model_path)
+    _exists_cache.pop(model_path, None)
+    # The quantized inference copy was built from the old checkpoint; drop
+    # it so simulate/interact pick up the freshly trained weights.
+    with _AGENT_CACHE_LOCK:
+        AGENT_CACHE.pop((character_id, agent.action_dim, True), None)
+
+
+def get_agent_for_character(character_id: int, env,
+                            inference_only: bool = False) -> PPOAgent:
+    # Inference and train-mode agents are cached under distinct keys: the
+    # quantized copy serves simulate/interact traffic, training keeps FP32.
+    # action_dim is part of the key so the 6-action solo agent and the
+    # 12-action interaction agent never alias each other.
+    action_dim = len(env.action_space)
+    cache_key = (character_id, action_dim, inference_only)
+    with _AGENT_CACHE_LOCK:
+        agent = AGENT_CACHE.get(cache_key)
+        if agent is not None:
+            AGENT_CACHE.move_to_end(cache_key)
+            return agent
+    agent = PPOAgent(STATE_DIM, action_dim)
+    model_path = os.path.join(MODEL_DIR, f"ppo_{character_id}.pt")
+    if _model_exists(model_path):
+        try:
+            agent.load_model(model_path)
+        except RuntimeError:
+            # Checkpoint was trained against a different action space (solo
+            # vs interaction env) — start fresh rather than failing the
+            # request on the state-dict shape mismatch.
+            pass
+    if inference_only:
+        # Dynamic int8: half the weight bytes and memory bandwidth on the
+        # Linear-dominated policy forward; optimizer state stays untouched
+        # because this copy never trains.
+        agent.policy = torch.ao.quantization.quantize_dynamic(
+            agent.policy, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    if COMPILE_POLICY:
+        agent.policy = torch.compile(
+            agent.policy, mode="reduce-overhead", dynamic=False
+        )
+        shape_key = (agent.state_dim, agent.action_dim)
+        if shape_key not in _COMPILED_SHAPES:
+            # Only the first agent of a given shape pays compile + capture:
+            # Dynamo caches the artifact on PolicyNetwork.forward's code
+            # object, so every later agent with the same dims reuses it and
+            # the warm-up forwards become redundant.
+            dummy = torch.zeros(1, agent.state_dim)
+            with torch.no_grad():
+                for _ in range(3):
+                    agent.policy(dummy)
+            _COMPILED_SHAPES.add(shape_key)
+    with _AGENT_CACHE_LOCK:
+        AGENT_CACHE[cache_key] = agent
+        evicted = False
+        while (
+            len(AGENT_CACHE) > 1
+            and sum(a.param_bytes for a in AGENT_CACHE.values())
+            > AGENT_CACHE_MAX_BYTES
+        ):
+            AGENT_CACHE.popitem(last=False)
+            evicted = True
+    # empty_cache only after crossing the high-water mark — calling it in the
+    # hot path would serialize the CUDA stream on every request.
+    if evicted and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    return agent
+
+
+def run_simulation(agent: PPOAgent, env, steps: int, deterministic: bool = False):
+    """Roll out ``steps`` transitions with one policy forward per tick.
+
+    ``env`` may be a single :class:`CharacterEnvironment` or an already
+    vectorized batch; single envs are wrapped so the same batched code path
+    serves both — for N parallel envs one forward produces N actions,
+    amortizing Python and tensor-allocation overhead across the batch.
+    """
+    if isinstance(env, CharacterEnvironment):
+        env = VectorCharacterEnvironment([env])
+    states = env.reset()
+    # Columnar trajectory (SoA): the hot loop only writes into two
+    # preallocated arrays; the dict-per-step view is assembled once at the
+    # end instead of allocating N dicts every tick.
+    actions_buf = np.empty((steps, env.num_envs), dtype=np.int64)
+    rewards_buf = np.empty((steps, env.num_envs), dtype=np.float32)
+    for step in range(steps):
+        if deterministic:
+            actions = agent.select_action_greedy(states)
+        else:
+            actions, _log_probs = agent.select_action_batch(states)
+        actions_buf[step] = actions
+        states, rewards, dones, _ = env.step(actions)
+        rewards_buf[step] = rewards
+    total_rewards = rewards_buf.sum(axis=0, dtype=np.float64)
+    histories = [
+        [
+            {
+                "step": step,
+                "action": e.action_space[actions_buf[step, i]],
+                "outcome": "顺利" if rewards_buf[step, i] > 0 else "受挫",
+                "reward": float(rewards_buf[step, i]),
+            }
+            for step in range(steps)
+        ]
+        for i, e in enumerate(env.envs)
+    ]
+    return histories, total_rewards
+
+
+def train_agent(agent: PPOAgent, env, episodes: int = 10,
+                steps_per_episode: int = 200):
+    episode_rewards = []
+    # One host buffer for the whole training run: select_action and the value
+    # read share it, so no per-step allocation (pinned when copies go to GPU).
+    state_tensor = torch.empty(
+        (1, agent.state_dim), pin_memory=torch.cuda.is_available()
+    )
+    # SoA trajectory buffers, allocated once and overwritten each episode —
+    # indexed writes instead of six list.append()s per step, and the arrays
+    # go straight into GAE/update_policy with no re-stacking.
+    states = np.empty((steps_per_episode, agent.state_dim), dtype=np.float32)
+    actions = np.empty(steps_per_episode, dtype=np.int64)
+    log_probs = np.empty(steps_per_episode, dtype=np.float32)
+    rewards = np.empty(steps_per_episode, dtype=np.float32)
+    dones = np.empty(steps_per_episode, dtype=np.bool_)
+    values = np.empty(steps_per_episode, dtype=np.float32)
+    for _ in range(episodes):
+        state = env.reset()
+        total = 0.0
+        for t in range(steps_per_episode):
+            action, log_prob, value = agent.select_action(state, state_tensor)
+            states[t] = state
+            next_state, reward, done, _ = env.step(action)
+            actions[t] = action
+            log_probs[t] = log_prob
+            rewards[t] = reward
+            dones[t] = done
+            values[t] = value
+            total += reward
+            state = next_state
+            if done:
+                state = env.reset()
+        state_tensor[0].copy_(torch.as_tensor(state))
+        with torch.no_grad():
+            _, last_value = agent.policy(state_tensor)
+        returns, advantages = agent.compute_returns_and_advantages(
+            rewards, values, dones, float(last_value.item())
+        )
+        agent.update_policy(states, actions, log_probs, returns, advantages)
+        episode_rewards.append(total)
+    return episode_rewards
+
+
+def simulate_agents_interaction_batch(agent1: PPOAgent, agent2: PPOAgent,
+                                      envs, rounds: int = 10) -> np.ndarray:
+    """M independent rollouts of the same pair, stepped in lock-step.
+
+    Each round is two batched forwards (agent1 over all M envs, then
+    agent2) instead of 2*M sequential single-state calls, so collecting M
+    rollouts costs barely more than one. Returns per-rollout reward totals
+    shaped ``(M, 2)``.
+    """
+    vec = VectorCharacterEnvironment(envs)
+    states = vec.reset()
+    totals = np.zeros((vec.num_envs, 2), dtype=np.float64)
+    for _ in range(rounds):
+        actions1, _ = agent1.select_action_batch(states)
+        states, rewards1, _, _ = vec.step(actions1)
+        actions2, _ = agent2.select_action_batch(states)
+        states, rewards2, _, _ = vec.step(actions2)
+        totals[:, 0] += rewards1
+        totals[:, 1] += rewards2
+    return totals
+
+
+def simulate_agents_interaction(agent1: PPOAgent, agent2: PPOAgent, env,
+                                rounds: int = 10):
+    state = env.reset()
+    log = []
+    totals = [0.0, 0.0]
+    for round_no in range(rounds):
+        action1, _, _ = agent1.select_action(state)
+        next_state, reward1, done, _ = env.step(action1)
+        # select_action only reads the state (one copy_ into its input
+        # tensor), so agent2 can see the env buffer directly — no defensive
+        # per-round ndarray copy.
+        action2, _, _ = agent2.select_action(next_state)
+        next_state, reward2, done, _ = env.step(action2)
+        totals[0] += reward1
+        totals[1] += reward2
+        log.append({
+            "round": round_no + 1,
+            "actions": [env.action_space[action1], env.action_space[action2]],
+            "rewards": [float(reward1), float(reward2)],
+        })
+        state = next_state
+        if done:
+            state = env.reset()
+    if totals[0] > 0 and totals[1] > 0:
+        outcome = "双方互利共赢"
+    elif totals[0] > totals[1]:
+        outcome = "前者占据上风"
+    elif totals[1] > totals[0]:
+        outcome = "后者占据上风"
+    else:
+        outcome = "势均力敌"
+    return {"log": log, "totals": totals, "outcome": outcome}
+
+
+def update_character_based_on_simulation(db: Session, character: Character,
+                                         total_reward: float) -> float:
+    delta = max(-5.0, min(5.0, total_reward))
+    # bulk_update_mappings emits one UPDATE without flushing the whole
+    # session state, and batches naturally when scripted traffic simulates
+    # many characters on one session.
+    db.bulk_update_mappings(Character, [{
+        "id": character.id,
+        "fate_score": max(0.0, min(100.0, character.fate_score + delta)),
+        "last_simulation_date": datetime.now(timezone.utc),
+    }])
+    if abs(delta) >= 3.0:
+        db.bulk_save_objects([DestinyNode(
+            character_id=character.id,
+            event_type="模拟",
+            description="行为模拟显著改变命运走向",
+            fate_impact=delta,
+            is_critical=True,
+        )])
+    db.commit()
+    return delta
+
+
+def _get_owned_character(db: Session, character_id: int, user_id: int) -> Character:
+    character = (
+        db.query(Character)
+        .filter(Character.id == character_id, Character.user_id == user_id)
+        .first()
+    )
+    if character is None:
+        raise HTTPException(status_code=404, detail="角色不存在")
+    return character
+
+
+@router.post("/characters/{character_id}/simulate")
+def simulate_character_behavior(
+    character_id: int,
+    data: SimulationRequest,
+    stream: bool = True,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    character = _get_owned_character(db, character_id, current_user.id)
+    env = CharacterEnvironment(character.to_profile())
+    if data.scenario:
+        env.configure_scenario(data.scenario)
+    agent = get_agent_for_character(character_id, env, inference_only=True)
+
+    if not stream:  # buffered JSON variant for clients that predate ndjson
+        histories, totals = run_simulation(agent, env, data.steps, data.deterministic)
+        fate_delta = update_character_based_on_simulation(db, character, float(totals[0]))
+        return {
+            "character_id": character_id,
+            "history": histories[0],
+            "total_reward": float(totals[0]),
+            "fate_delta": fate_delta,
+        }
+
+    vec = VectorCharacterEnvironment([env])
+
+    def event_stream():
+        # One JSON line per step: TTFB is O(1) instead of O(steps), and no
+        # history list accumulates server-side. The last line carries totals.
+        states = vec.reset()
+        total = 0.0
+        for step in range(data.steps):
+            if data.deterministic:
+                actions = agent.select_action_greedy(states)
+            else:
+                actions, _ = agent.select_action_batch(states)
+            states_next, rewards, _, _ = vec.step(actions)
+            reward = float(rewards[0])
+            total += reward
+            yield orjson.dumps({
+                "step": step,
+                "action": env.action_space[int(actions[0])],
+                "outcome": "顺利" if reward > 0 else "受挫",
+                "reward": reward,
+            }) + b"\n"
+            states = states_next
+        fate_delta = update_character_based_on_simulation(db, character, total)
+        yield orjson.dumps({
+            "character_id": character_id,
+            "total_reward": total,
+            "fate_delta": fate_delta,
+        }) + b"\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+@router.post("/interact")
+def simulate_character_interaction(
+    data: InteractionRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    # Both characters in one IN query — one round-trip instead of two.
+    rows = {
+        c.id: c
+        for c in db.query(Character)
+        .filter(
+            Character.id.in_((data.character_id_1, data.character_id_2)),
+            Character.user_id == current_user.id,
+        )
+        .all()
+    }
+    char1 = rows.get(data.character_id_1)
+    char2 = rows.get(data.character_id_2)
+    if char1 is None or char2 is None:
+        raise HTTPException(status_code=404, detail="角色不存在")
+    env = create_interaction_environment(
+        char1.to_profile(), char2.to_profile(), data.scenario
+    )
+    agent1 = get_agent_for_character(char1.id, env, inference_only=True)
+    agent2 = get_agent_for_character(char2.id, env, inference_only=True)
+    if data.rollouts > 1:
+        envs = [env] + [
+            create_interaction_environment(
+                char1.to_profile(), char2.to_profile(), data.scenario
+            )
+            for _ in range(data.rollouts - 1)
+        ]
+        totals = simulate_agents_interaction_batch(agent1, agent2, envs, data.rounds)
+        mean = totals.mean(axis=0)
+        if mean[0] > 0 and mean[1] > 0:
+            outcome = "双方互利共赢"
+        elif mean[0] > mean[1]:
+            outcome = "前者占据上风"
+        elif mean[1] > mean[0]:
+            outcome = "后者占据上风"
+        else:
+            outcome = "势均力敌"
+        result = {
+            "rollouts": data.rollouts,
+            "totals": totals.tolist(),
+            "mean_totals": mean.tolist(),
+            "outcome": outcome,
+        }
+    else:
+        result = simulate_agents_interaction(agent1, agent2, env, data.rounds)
+    result["characters"] = [char1.name, char2.name]
+    return result
+
+
+@router.post("/characters/{character_id}/train")
+def train_character_agent(
+    character_id: int,
+    data: TrainRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    character = _get_owned_character(db, character_id, current_user.id)
+    env = CharacterEnvironment(character.to_profile())
+    agent = get_agent_for_character(character_id, env)
+    episode_rewards = train_agent(agent, env, data.episodes, data.steps_per_episode)
+    # Checkpoint serialization happens after the response is sent instead of
+    # adding Torch-deserialization-scale latency to the request itself.
+    background_tasks.add_task(
+        _save_agent, agent, os.path.join(MODEL_DIR, f"ppo_{character_id}.pt"),
+        character_id,
+    )
+    return {
+        "character_id": character_id,
+        "episodes": data.episodes,
+        "episode_rewards": episode_rewards,
+        "mean_reward": sum(episode_rewards) / len(episode_rewards),
+    }
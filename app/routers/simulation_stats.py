@@ -0,0 +1,71 @@
+"""模拟统计 endpoints: event timelines and aggregate counters."""
+
+import asyncio
+from datetime import datetime, time, timedelta, timezone
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth import get_current_user
+from app.database import AsyncSessionLocal, get_async_db
+from app.models.causal import CausalEvent
+from app.models.character import Character
+from app.models.user import User
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get("/timeline")
+async def get_event_timeline(
+    days: int = 7,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Daily event counts for the last ``days`` days, zero-filled."""
+    today = datetime.now(timezone.utc).date()
+    start = today - timedelta(days=days - 1)
+    # One GROUP BY over the window instead of a COUNT(*) round trip per
+    # day; missing days are filled with zeros in Python.
+    # asyncpg won't coerce a date for the naive DateTime column — bind the
+    # window start as a naive datetime at midnight.
+    result = await db.execute(
+        select(func.date(CausalEvent.timestamp).label("d"), func.count())
+        .where(CausalEvent.timestamp >= datetime.combine(start, time.min))
+        .group_by("d")
+    )
+    counts = {row.d: row[1] for row in result}
+    timeline = [
+        {"date": str(day), "events": counts.get(day, 0)}
+        for day in (start + timedelta(days=i) for i in range(days))
+    ]
+    return {"days": days, "timeline": timeline}
+
+
+async def _scalar(stmt):
+    # One session (and pooled connection) per coroutine — an AsyncSession
+    # serializes all work on a single connection, which would defeat gather.
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(stmt)
+
+
+@router.get("/summary")
+async def get_summary(
+    current_user: User = Depends(get_current_user),
+):
+    # Naive UTC to match the column: asyncpg refuses an aware datetime
+    # against the naive timestamp (utcnow-defaulted) column.
+    since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=24)
+    char_count, event_count, recent_active = await asyncio.gather(
+        _scalar(select(func.count(Character.id))),
+        _scalar(select(func.count(CausalEvent.id))),
+        _scalar(
+            select(func.count(func.distinct(CausalEvent.actor_id)))
+            .where(CausalEvent.timestamp >= since)
+        ),
+    )
+    return {
+        "characters": char_count,
+        "events": event_count,
+        "active_last_24h": recent_active,
+    }
@@ -0,0 +1,466 @@
+"""社会模拟 endpoints: 政权状态、社会事件与阶层演化."""
+
+from typing import List, Optional
+
+import numpy as np
+from fastapi import APIRouter, Depends
+from sqlalchemy import (
+    bindparam,
+    case,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app import cache
+from app.ai.utils import HAS_NUMBA, njit
+from app.auth import get_current_user
+from app.database import get_async_db
+from app.models.society import Regime, SocialClass, SocialClassEvent, SocialEvent
+from app.models.user import User
+from app.schemas.society import (
+    RegimeCreate,
+    RegimeOut,
+    SocialClassOut,
+    SocialEventCreate,
+    SocialEventOut,
+)
+
+router = APIRouter(prefix="/society", tags=["society"])
+
+EVENT_TYPES = ("革命", "改革", "战争", "灾难", "繁荣")
+
+_RNG = np.random.default_rng()
+
+# The whole regime drift happens server-side in one UPDATE; RETURNING hands
+# back the new values so the loaded instance can be synced without a SELECT.
+_EVOLVE_REGIME_SQL = text(
+    "UPDATE regime SET "
+    "stability = stability * 0.9 + satisfaction * 0.1, "
+    "corruption = LEAST(1.0, corruption + 0.005), "
+    "prosperity = GREATEST(0.0, LEAST(1.0, prosperity + :noise)), "
+    "satisfaction = CASE WHEN corruption > 0.5 "
+    "THEN GREATEST(0.0, satisfaction - 0.01) ELSE satisfaction END "
+    "WHERE id = :id "
+    "RETURNING satisfaction, corruption, stability, prosperity"
+)
+
+_EVOLVED_FIELDS = ("satisfaction", "corruption", "stability", "prosperity")
+
+# lambda_stmt caches the construction and compilation of this hot statement;
+# it runs on nearly every society request (cache misses and writers).
+LATEST_REGIME_STMT = lambda_stmt(
+    lambda: select(Regime).order_by(Regime.timestamp.desc()).limit(1)
+)
+
+REGIME_FIELDS = ("satisfaction", "corruption", "stability", "prosperity", "freedom")
+
+STATE_IDX = {name: i for i, name in enumerate(REGIME_FIELDS)}
+
+
+@njit(cache=True)
+def _apply_delta(state: np.ndarray, deltas: np.ndarray) -> np.ndarray:
+    """Add ``deltas`` onto ``state`` in place, clamping each field to [0, 1]."""
+    for i in range(state.shape[0]):
+        value = state[i] + deltas[i]
+        if value < 0.0:
+            value = 0.0
+        elif value > 1.0:
+            value = 1.0
+        state[i] = value
+    return state
+
+
+if HAS_NUMBA:  # pay the compile cost at import, not on the first event
+    _apply_delta(np.zeros(len(REGIME_FIELDS)), np.zeros(len(REGIME_FIELDS)))
+
+
+# Fixed impact profiles for the known event types; unknown types fall back
+# to a small random perturbation in generate_default_impact.
+_IMPACT_TABLE = {
+    "革命": {
+        "satisfaction": -0.2, "corruption": -0.15, "stability": -0.3,
+        "prosperity": -0.1, "freedom": 0.2,
+    },
+    "改革": {
+        "satisfaction": 0.1, "corruption": -0.1, "stability": 0.05,
+        "prosperity": 0.1, "freedom": 0.1,
+    },
+    "战争": {
+        "satisfaction": -0.15, "corruption": 0.05, "stability": -0.2,
+        "prosperity": -0.2, "freedom": -0.1,
+    },
+    "灾难": {
+        "satisfaction": -0.2, "corruption": 0.0, "stability": -0.1,
+        "prosperity": -0.15, "freedom": 0.0,
+    },
+    "繁荣": {
+        "satisfaction": 0.15, "corruption": 0.05, "stability": 0.1,
+        "prosperity": 0.2, "freedom": 0.05,
+    },
+}
+
+
+def generate_default_impact(event_type: str) -> dict:
+    profile = _IMPACT_TABLE.get(event_type)
+    if profile is not None:
+        # Copy so callers mutating the impact can't corrupt the table.
+        return dict(profile)
+    noise = _RNG.uniform((-0.1, -0.05, -0.1, -0.1, -0.05),
+                         (0.1, 0.05, 0.1, 0.1, 0.05))
+    return dict(zip(REGIME_FIELDS, noise.tolist()))
+
+
+async def apply_event_impact(
+    db: AsyncSession, regime: Regime, impact: dict, commit: bool = True
+) -> None:
+    state = np.array([getattr(regime, f) for f in REGIME_FIELDS], dtype=np.float64)
+    deltas = np.zeros(len(REGIME_FIELDS))
+    for field, delta in impact.items():
+        idx = STATE_IDX.get(field)
+        if idx is not None:
+            deltas[idx] = delta
+    _apply_delta(state, deltas)
+    for field, value in zip(REGIME_FIELDS, state.tolist()):
+        setattr(regime, field, value)
+    if commit:
+        await db.commit()
+        await cache.invalidate(cache.REGIME_KEY)
+
+
+# (event_type, class_name) -> happiness delta; a None class is the
+# wildcard row for event types that hit every class.
+_CLASS_IMPACT = {
+    ("革命", "统治阶层"): -0.3,
+    ("革命", "底层民众"): 0.2,
+    ("改革", "中产阶级"): 0.2,
+    ("战争", None): -0.2,
+    ("灾难", "底层民众"): -0.3,
+    ("灾难", None): -0.1,
+    ("繁荣", None): 0.1,
+}
+
+
+def _impact_for(event_type: str, class_name: str) -> float:
+    specific = _CLASS_IMPACT.get((event_type, class_name))
+    if specific is not None:
+        return specific
+    return _CLASS_IMPACT.get((event_type, None), 0.0)
+
+
+async def apply_event_to_classes(
+    db: AsyncSession, event: SocialEvent, regime_id: int, commit: bool = True
+) -> None:
+    # Two statements total instead of one UPDATE/INSERT per class: a CASE
+    # keyed on the class name applies every happiness delta server-side, and
+    # the child rows go in with one executemany.
+    result = await db.execute(
+        select(SocialClass.id, SocialClass.name)
+        .where(SocialClass.regime_id == regime_id)
+    )
+    rows = result.all()
+    impacts = {name: _impact_for(event.event_type, name) for _, name in rows}
+    await db.execute(
+        update(SocialClass)
+        .where(SocialClass.regime_id == regime_id)
+        .values(
+            happiness=func.greatest(0.0, func.least(
+                1.0,
+                SocialClass.happiness
+                + case(impacts, value=SocialClass.name, else_=0.0),
+            ))
+        )
+    )
+    await db.execute(insert(SocialClassEvent), [
+        {"event_id": event.id, "class_id": class_id, "impact": impacts[name]}
+        for class_id, name in rows
+    ])
+    if commit:
+        await db.commit()
+
+
+async def evolve_regime(
+    db: AsyncSession, regime: Regime, commit: bool = True,
+    noise: Optional[float] = None,
+) -> None:
+    # Batch callers pre-draw the prosperity noise; one-shot callers draw here.
+    if noise is None:
+        noise = float(_RNG.uniform(-0.01, 0.01))
+    result = await db.execute(
+        _EVOLVE_REGIME_SQL, {"noise": noise, "id": regime.id}
+    )
+    row = result.first()
+    if row is not None:
+        # Sync the loaded instance with the server-computed values without
+        # marking it dirty (which would re-issue the same UPDATE at commit).
+        for field, value in zip(_EVOLVED_FIELDS, row):
+            set_committed_value(regime, field, value)
+    if commit:
+        await db.commit()
+        await cache.invalidate(cache.REGIME_KEY)
+
+
+async def evolve_social_classes(
+    db: AsyncSession, regime_id: int, commit: bool = True
+) -> None:
+    # Drift all classes in one go: a (N, 3) array gets noised and clamped
+    # with NumPy, then written back through a single executemany UPDATE
+    # instead of loading and dirtying N ORM instances.
+    result = await db.execute(
+        select(SocialClass.id, SocialClass.wealth, SocialClass.happiness,
+               SocialClass.education)
+        .where(SocialClass.regime_id == regime_id)
+    )
+    rows = result.all()
+    if not rows:
+        return
+    values = np.array([row[1:] for row in rows], dtype=np.float64)
+    noise = _RNG.uniform((-0.01, -0.01, -0.005), 0.01, size=values.shape)
+    np.clip(values + noise, 0.0, 1.0, out=values)
+    await db.execute(
+        update(SocialClass)
+        .where(SocialClass.id == bindparam("b_id"))
+        .values(wealth=bindparam("b_wealth"),
+                happiness=bindparam("b_happiness"),
+                education=bindparam("b_education")),
+        [
+            {"b_id": row[0], "b_wealth": w, "b_happiness": h, "b_education": e}
+            for row, (w, h, e) in zip(rows, values.tolist())
+        ],
+    )
+    if commit:
+        await db.commit()
+
+
+async def create_default_regime(db: AsyncSession) -> Regime:
+    regime = Regime(name="默认政权", regime_type="君主制")
+    db.add(regime)
+    # flush populates the PK via RETURNING — no refresh SELECT needed; the
+    # classes helper issues the commit for the whole unit.
+    await db.flush()
+    await create_default_social_classes(db, regime.id)
+    return regime
+
+
+async def create_default_social_classes(db: AsyncSession, regime_id: int) -> list:
+    classes = [
+        SocialClass(regime_id=regime_id, name="统治阶层", population=0.1,
+                    wealth=0.8, happiness=0.7, education=0.8, mobility=0.2),
+        SocialClass(regime_id=regime_id, name="中产阶级", population=0.3,
+                    wealth=0.5, happiness=0.5, education=0.6, mobility=0.5),
+        SocialClass(regime_id=regime_id, name="底层民众", population=0.6,
+                    wealth=0.2, happiness=0.4, education=0.3, mobility=0.3),
+    ]
+    # One batched INSERT; the flush RETURNING populates the PKs so callers
+    # like apply_event_to_classes can use them without a refresh per row.
+    db.add_all(classes)
+    await db.flush()
+    await db.commit()
+    return classes
+
+
+async def _get_latest_regime(db: AsyncSession) -> Regime:
+    result = await db.execute(LATEST_REGIME_STMT)
+    regime = result.scalar_one_or_none()
+    if regime is None:
+        regime = await create_default_regime(db)
+    return regime
+
+
+async def get_latest_regime_cached(db: AsyncSession) -> dict:
+    """Serialized latest-regime payload, cached in Redis for a few seconds.
+
+    Read endpoints hit this instead of re-running the ORDER BY timestamp
+    scan per request; writers invalidate the key after committing.
+    """
+    payload = await cache.get_cached(cache.REGIME_KEY)
+    if payload is None:
+        payload = _regime_dict(await _get_latest_regime(db))
+        await cache.set_cached(cache.REGIME_KEY, payload, cache.REGIME_TTL)
+    return payload
+
+
+def _regime_dict(regime: Regime) -> dict:
+    return {
+        "id": regime.id,
+        "name": regime.name,
+        "regime_type": regime.regime_type,
+        "satisfaction": regime.satisfaction,
+        "corruption": regime.corruption,
+        "stability": regime.stability,
+        "prosperity": regime.prosperity,
+        "freedom": regime.freedom,
+        "timestamp": regime.timestamp,
+    }
+
+
+@router.post("/regime", response_model=RegimeOut)
+async def create_regime(
+    data: RegimeCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    regime = Regime(name=data.name, regime_type=data.regime_type)
+    db.add(regime)
+    await db.flush()
+    await create_default_social_classes(db, regime.id)
+    await cache.invalidate(cache.REGIME_KEY)
+    return regime
+
+
+@router.get("/regime", response_model=RegimeOut)
+async def get_regime_state(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    return await get_latest_regime_cached(db)
+
+
+@router.post("/events", response_model=SocialEventOut)
+async def create_social_event(
+    data: SocialEventCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    regime = await _get_latest_regime(db)
+    impact = data.impact or generate_default_impact(data.event_type)
+    event = SocialEvent(
+        regime_id=regime.id,
+        name=data.name,
+        event_type=data.event_type,
+        description=data.description,
+        impact=impact,
+        duration=data.duration,
+    )
+    db.add(event)
+    await db.flush()
+    await apply_event_impact(db, regime, impact)
+    await apply_event_to_classes(db, event, regime.id)
+    return event
+
+
+@router.get("/events", response_model=List[SocialEventOut])
+async def get_social_events(
+    skip: int = 0,
+    limit: int = 50,
+    event_type: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    regime_payload = await get_latest_regime_cached(db)
+    # Column-only select: Row tuples skip ORM instrumentation and the
+    # identity map, and still validate against the from_attributes schema.
+    query = select(
+        SocialEvent.id, SocialEvent.regime_id, SocialEvent.name,
+        SocialEvent.event_type, SocialEvent.description, SocialEvent.impact,
+        SocialEvent.duration, SocialEvent.is_active, SocialEvent.timestamp,
+    ).where(SocialEvent.regime_id == regime_payload["id"])
+    if event_type:
+        query = query.where(SocialEvent.event_type == event_type)
+    result = await db.execute(
+        query.order_by(SocialEvent.timestamp.desc()).offset(skip).limit(limit)
+    )
+    return result.all()
+
+
+@router.get("/classes", response_model=List[SocialClassOut])
+async def get_social_classes(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    regime_payload = await get_latest_regime_cached(db)
+    result = await db.execute(
+        select(
+            SocialClass.id, SocialClass.regime_id, SocialClass.name,
+            SocialClass.population, SocialClass.wealth, SocialClass.happiness,
+            SocialClass.education, SocialClass.mobility,
+        ).where(SocialClass.regime_id == regime_payload["id"])
+    )
+    return result.all()
+
+
+@router.get("/status")
+async def get_social_status(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    regime_payload = await get_latest_regime_cached(db)
+    regime_id = regime_payload["id"]
+    events_result = await db.execute(
+        select(SocialEvent)
+        .where(SocialEvent.regime_id == regime_id, SocialEvent.is_active.is_(True))
+        .order_by(SocialEvent.timestamp.desc())
+    )
+    classes_result = await db.execute(
+        select(SocialClass).where(SocialClass.regime_id == regime_id)
+    )
+    return {
+        "regime": regime_payload,
+        "active_events": [
+            {
+                "id": e.id,
+                "name": e.name,
+                "event_type": e.event_type,
+                # Raw datetime: orjson serializes it natively in the
+                # response encoder, cheaper than any Python-side format.
+                "timestamp": e.timestamp,
+            }
+            for e in events_result.scalars()
+        ],
+        "classes": [
+            {"name": c.name, "happiness": c.happiness, "wealth": c.wealth}
+            for c in classes_result.scalars()
+        ],
+    }
+
+
+@router.post("/simulate")
+async def simulate_next_social_change(
+    steps: int = 1,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    regime = await _get_latest_regime(db)
+    created_events = []
+    # Draw all the loop's randomness up front in three vectorized calls
+    # instead of several random.* calls per step.
+    coin = _RNG.random(steps)
+    types = _RNG.choice(EVENT_TYPES, size=steps)
+    durations = _RNG.integers(10, 101, size=steps)
+    prosperity_noise = _RNG.uniform(-0.01, 0.01, size=steps)
+    # One transaction for the whole loop: helpers run with commit=False and
+    # events get their PKs from a flush, so an N-step simulation does a
+    # single COMMIT (and cache invalidation) instead of ~5 per step.
+    for i in range(steps):
+        if coin[i] < 0.3:
+            event_type = str(types[i])
+            impact = generate_default_impact(event_type)
+            event = SocialEvent(
+                regime_id=regime.id,
+                name=f"自发{event_type}",
+                event_type=event_type,
+                impact=impact,
+                duration=int(durations[i]),
+            )
+            db.add(event)
+            await db.flush()
+            await apply_event_impact(db, regime, impact, commit=False)
+            await apply_event_to_classes(db, event, regime.id, commit=False)
+            created_events.append(
+                {"id": event.id, "name": event.name, "event_type": event.event_type}
+            )
+        await evolve_regime(db, regime, commit=False,
+                            noise=float(prosperity_noise[i]))
+        await evolve_social_classes(db, regime.id, commit=False)
+    await db.commit()
+    await cache.invalidate(cache.REGIME_KEY)
+    return {
+        "steps": steps,
+        "events": created_events,
+        "regime": _regime_dict(regime),
+    }
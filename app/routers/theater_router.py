@@ -0,0 +1,64 @@
+"""命运剧场 endpoints: causal event feeds and generated scripts."""
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth import get_current_user
+from app.core.drama_builder import generate_fate_theater
+from app.database import get_async_db
+from app.models.causal import CausalEvent
+from app.models.character import Character
+from app.models.user import User
+
+router = APIRouter(prefix="/theater", tags=["theater"])
+
+
+def _fmt(dt) -> str:
+    # isoformat is several times cheaper than strftime's locale-aware path;
+    # the replace restores the "YYYY-MM-DD HH:MM" shape clients expect.
+    return dt.isoformat(timespec="minutes").replace("T", " ")
+
+
+@router.get("/characters/{character_id}/events")
+async def get_character_events(
+    character_id: int,
+    skip: int = 0,
+    limit: int = 50,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    result = await db.execute(
+        select(Character.id).where(
+            Character.id == character_id, Character.user_id == current_user.id
+        )
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="角色不存在")
+    result = await db.execute(
+        select(CausalEvent.id, CausalEvent.actor_id, CausalEvent.target_id,
+               CausalEvent.action, CausalEvent.description,
+               CausalEvent.timestamp)
+        .where(or_(CausalEvent.actor_id == character_id,
+                   CausalEvent.target_id == character_id))
+        .order_by(CausalEvent.timestamp.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    # Row tuples skip ORM hydration; _mapping reuses the shared row schema.
+    return [
+        {**row._mapping, "timestamp": _fmt(row.timestamp)}
+        for row in result.all()
+    ]
+
+
+@router.get("/script/{event_id}")
+async def get_fate_script(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    script = await generate_fate_theater(event_id, db)
+    if not script["scenes"]:
+        raise HTTPException(status_code=404, detail="事件不存在")
+    return script
@@ -0,0 +1,138 @@
+"""WebSocket 模拟推送: live simulation state for the admin frontend."""
+
+import asyncio
+import os
+
+import orjson
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+from app import cache
+
+router = APIRouter(tags=["ws"])
+
+# Cross-worker fan-out: state frames go through this Redis channel so every
+# Uvicorn worker's subscriber pushes to its own local client set.
+_CHANNEL = "sim:state"
+
+# Frames a slow client may have outstanding before it is disconnected —
+# bounded so one stuck consumer cannot buffer unbounded memory.
+WS_MESSAGE_QUEUE_SIZE = int(os.environ.get("WS_MESSAGE_QUEUE_SIZE", "32"))
+
+simulation_state = {"tick": 0, "running": False, "last_event": None}
+
+# The encoded frame is cached across broadcasts and rebuilt only when the
+# state changed, so N clients share one encode instead of N str→bytes runs.
+_frame: bytes = b""
+_frame_stale = True
+
+
+class _ClientHandle:
+    """A connected client: its socket, bounded frame queue and writer task.
+
+    The writer drains the queue onto the socket, so broadcast never awaits
+    a send — each client consumes at its own pace behind its queue.
+    """
+
+    __slots__ = ("ws", "queue", "task")
+
+    def __init__(self, ws: WebSocket):
+        self.ws = ws
+        self.queue = asyncio.Queue(maxsize=WS_MESSAGE_QUEUE_SIZE)
+        self.task = asyncio.create_task(self._write_loop())
+
+    async def _write_loop(self) -> None:
+        try:
+            while True:
+                await self.ws.send_bytes(await self.queue.get())
+        except Exception:
+            clients.discard(self)
+
+
+clients: set = set()
+
+
+def _mark_stale() -> None:
+    global _frame_stale
+    _frame_stale = True
+
+
+async def _drop(handle: _ClientHandle) -> None:
+    clients.discard(handle)
+    handle.task.cancel()
+    try:
+        await handle.ws.close()
+    except Exception:
+        pass
+
+
+async def _fan_out(frame: bytes) -> None:
+    """Queue ``frame`` for every local client.
+
+    put_nowait never blocks the broadcaster; a client whose queue is full
+    is too far behind and gets disconnected instead of buffering forever.
+    """
+    for handle in tuple(clients):
+        try:
+            handle.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            await _drop(handle)
+
+
+async def broadcast_state() -> None:
+    """Publish the current state to every client on every worker."""
+    global _frame, _frame_stale
+    if _frame_stale:
+        # Snapshot before encoding: other handlers may mutate
+        # simulation_state while frames are in flight. orjson emits bytes
+        # directly — no intermediate str or .encode().
+        snapshot = dict(simulation_state)
+        _frame = orjson.dumps({"type": "state", "payload": snapshot},
+                              default=str)
+        _frame_stale = False
+    # Through Redis the local subscriber (and every sibling worker's)
+    # delivers the frame; without Redis fall back to the local set only.
+    if not await cache.publish(_CHANNEL, _frame):
+        await _fan_out(_frame)
+
+
+async def subscribe_loop() -> None:
+    """Relay frames published on the state channel to local clients."""
+    pubsub = cache.pubsub()
+    if pubsub is None:
+        return
+    await pubsub.subscribe(_CHANNEL)
+    async for message in pubsub.listen():
+        if message["type"] == "message":
+            await _fan_out(message["data"])
+
+
+def start_subscriber():
+    """Spawn the pub/sub relay task at startup (no-op without Redis)."""
+    if cache.pubsub() is None:
+        return None
+    return asyncio.create_task(subscribe_loop())
+
+
+@router.websocket("/ws/simulation")
+async def simulation_ws(websocket: WebSocket):
+    await websocket.accept()
+    handle = _ClientHandle(websocket)
+    clients.add(handle)
+    try:
+        while True:
+            command = orjson.loads(await websocket.receive_text())
+            action = command.get("action")
+            if action == "start":
+                simulation_state["running"] = True
+                _mark_stale()
+            elif action == "stop":
+                simulation_state["running"] = False
+                _mark_stale()
+            elif action == "tick":
+                simulation_state["tick"] += 1
+                simulation_state["last_event"] = command.get("event")
+                _mark_stale()
+            await broadcast_state()
+    except WebSocketDisconnect:
+        clients.discard(handle)
+        handle.task.cancel()
@@ -0,0 +1,51 @@
+"""Pydantic schemas for characters."""
+
+import re
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+# Shape check only — a compiled regex is far cheaper than strptime and the
+# bazi engine re-parses the value anyway.
+_BIRTH_RE = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$")
+
+
+class CharacterBase(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    name: str
+    birth_time: str  # "YYYY-MM-DD HH:MM"
+
+    @field_validator("birth_time")
+    @classmethod
+    def validate_birth_time(cls, v):
+        if not _BIRTH_RE.match(v):
+            raise ValueError("出生时间格式应为 YYYY-MM-DD HH:MM")
+        return v
+
+
+class CharacterCreate(CharacterBase):
+    physique_weight: float = 1.0
+    intelligence_weight: float = 1.0
+    emotion_weight: float = 1.0
+    social_weight: float = 1.0
+
+
+class CharacterOut(CharacterBase):
+    model_config = ConfigDict(from_attributes=True, str_strip_whitespace=True)
+
+    id: int
+    user_id: int
+    dominant_wuxing: Optional[str] = None
+    fate_score: float
+    attributes: dict
+    personality: dict
+    created_at: datetime
+
+
+class CharacterPage(BaseModel):
+    """Keyset-paginated character listing."""
+
+    items: List[CharacterOut]
+    next_after_id: Optional[int] = None
@@ -0,0 +1,71 @@
+"""Pydantic schemas for destiny events."""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class DestinyNodeCreate(BaseModel):
+    character_id: int
+    parent_id: Optional[int] = None
+    event_type: str
+    description: str = ""
+    result: str = ""
+    consequence: str = ""
+    fate_impact: float = 0.0
+    is_critical: bool = False
+
+
+class DestinyNodeUpdate(BaseModel):
+    description: Optional[str] = None
+    result: Optional[str] = None
+    consequence: Optional[str] = None
+    fate_impact: Optional[float] = None
+    is_critical: Optional[bool] = None
+
+
+class DestinyNodeOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    character_id: int
+    parent_id: Optional[int] = None
+    event_type: str
+    description: str
+    result: str
+    consequence: str
+    fate_impact: float
+    is_critical: bool
+    timestamp: datetime
+
+
+class RelationshipOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    source_id: int
+    target_id: int
+    relation_type: str
+    strength: float
+
+
+class _CharacterFields(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    name: str
+    birth_time: str
+    dominant_wuxing: Optional[str] = None
+    fate_score: float
+    attributes: dict
+    personality: dict
+
+
+class CharacterWithEvents(_CharacterFields):
+    destiny_nodes: List[DestinyNodeOut] = []
+
+
+class CharacterWithRelationships(_CharacterFields):
+    relationships: List[RelationshipOut] = []
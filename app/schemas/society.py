@@ -0,0 +1,60 @@
+"""Pydantic schemas for the society simulation."""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RegimeCreate(BaseModel):
+    name: str
+    regime_type: str
+
+
+class SocialEventCreate(BaseModel):
+    name: str
+    event_type: str
+    description: str = ""
+    duration: int = 30
+    impact: Optional[dict] = None
+
+
+class RegimeOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    regime_type: str
+    satisfaction: float
+    corruption: float
+    stability: float
+    prosperity: float
+    freedom: float
+    timestamp: datetime
+
+
+class SocialEventOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    regime_id: int
+    name: str
+    event_type: str
+    description: str
+    impact: dict
+    duration: int
+    is_active: bool
+    timestamp: datetime
+
+
+class SocialClassOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    regime_id: int
+    name: str
+    population: float
+    wealth: float
+    happiness: float
+    education: float
+    mobility: float
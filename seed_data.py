@@ -0,0 +1,57 @@
+"""开发环境种子数据:默认用户、政权、社会阶层与示例角色.
+
+Usage: python seed_data.py
+"""
+
+from app.database import Base, SessionLocal, engine
+from app.models.character import Character  # noqa: F401  (register mappers)
+from app.models.destiny import DestinyNode  # noqa: F401
+from app.models.society import Regime, SocialClass
+from app.models.user import User
+from app.core.bazi_engine import analyze_character_fate
+
+
+def seed() -> None:
+    db = SessionLocal()
+    try:
+        # One transaction for the whole seed: flush the parents so their
+        # PKs exist for the child rows, then commit everything at once.
+        user = User(
+            username="admin",
+            hashed_password="dev-only",
+            api_token="dev-token",
+        )
+        regime = Regime(name="大明王朝", regime_type="君主制")
+        db.add_all((user, regime))
+        db.flush()
+
+        db.add_all([
+            SocialClass(regime_id=regime.id, name="统治阶层", population=0.1,
+                        wealth=0.8, happiness=0.7, education=0.8, mobility=0.2),
+            SocialClass(regime_id=regime.id, name="中产阶级", population=0.3,
+                        wealth=0.5, happiness=0.5, education=0.6, mobility=0.5),
+            SocialClass(regime_id=regime.id, name="底层民众", population=0.6,
+                        wealth=0.2, happiness=0.4, education=0.3, mobility=0.3),
+        ])
+        db.add_all([
+            Character(
+                user_id=user.id,
+                name=name,
+                birth_time=birth_time,
+                dominant_wuxing=analyze_character_fate(birth_time)["dominant"],
+                fate_score=50.0,
+                attributes={"physique": 5, "intelligence": 6,
+                            "emotion": 5, "social": 5},
+                personality={"O": 0.6, "C": 0.5, "E": 0.5, "A": 0.6, "N": 0.4},
+            )
+            for name, birth_time in (("李逍遥", "1995-06-15 08:30"),
+                                     ("赵灵儿", "1997-02-03 23:10"))
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    Base.metadata.create_all(bind=engine)
+    seed()